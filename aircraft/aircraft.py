@@ -2,6 +2,7 @@
 from pathlib import Path
 from typing import Iterator, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 
@@ -24,6 +25,7 @@ def _parse_aircraft(handle: TextIO) -> dict[str, str]:
     return aircraft_classes
 
 
+@timed("read_aircrafts")
 def read_aircrafts(root: str | Path) -> dict[str, str]:
     """Read aircrafts and proper names."""
 
@@ -0,0 +1,138 @@
+"""Per-mission analysis shared by the serial and the parallel runs."""
+
+import logging
+
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from auto_fixes.auto_fixes import auto_fixes_enabled, open_auto_fix_rewriter
+from catalog.catalog import AssetCatalog
+from config.app_settings import AppSettings
+from instrumentation.instrumentation import count, is_enabled, timed
+from conversions.static_conversions import ConversionMatcher
+from missions.mission_data import MissionData
+from missions.missions import MissionFile, check_mission_exists, read_mission
+from report.findings import Category, Finding, FindingRecorder, Severity
+from report.report import (
+    log_buildings,
+    log_chiefs,
+    log_missing_squadrons,
+    log_planes_details,
+    log_planes_without_markings,
+    log_stationaries,
+    log_used_aircrafts,
+    log_squadrons
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class MissionReport:
+    """Result of analyzing one mission.
+
+    ``findings`` holds the results as typed records; every report output,
+    the text one included, is rendered from them and the mission data, so
+    reports produced in worker processes can be written in campaign order.
+    ``full_report`` tells whether the used aircraft, wings, chiefs and
+    stationaries were recorded as well. ``source`` is the fingerprint of the
+    mission file as it was parsed (see :meth:`MissionFile.fingerprint`), set
+    for incremental runs. ``fixed_copy`` tells whether the output folder holds
+    an auto-fixed copy of the mission.
+    """
+
+    mission_name: str
+    mission_data: MissionData
+    missing_map: str | None
+    missing_objects: frozenset[str]
+    missing_aircrafts: frozenset[str]
+    findings: tuple[Finding, ...] = ()
+    full_report: bool = False
+    source: tuple[int, int, str] | None = None
+    fixed_copy: bool = False
+
+
+@timed("analyze_mission")
+def analyze_mission(
+    mission_path: Path,
+    catalog: AssetCatalog,
+    app_config: AppSettings,
+    conversions: ConversionMatcher | None = None,
+    mission_file: MissionFile | None = None,
+) -> MissionReport:
+    """Read a mission, apply the enabled auto-fixes and run every check.
+
+    ``conversions`` is the compiled conversion table used when
+    ``auto_replace_stationary_objects`` is enabled. ``mission_file`` is given
+    when the mission was read ahead.
+    """
+
+    mission_name = mission_path.name
+    logger.info("Analyzing mission %s", mission_name)
+    if mission_file is None:
+        check_mission_exists(mission_path)
+        mission_file = MissionFile.read(mission_path)
+
+    # The mission is read once: the auto-fix rewriter shares the parser's pass
+    with ExitStack() as stack:
+        rewriter = open_auto_fix_rewriter(stack, mission_path, app_config, conversions)
+        on_line = None
+        if rewriter is not None:
+            # Only pay for a per-line timer when profiling
+            on_line = timed("auto-fix rewrite")(rewriter.feed) if is_enabled() else rewriter.feed
+        mission_data = read_mission(mission_path, on_line, mission_file.contents)
+    count("missions analyzed")
+
+    if rewriter is not None:
+        fixed_copy = rewriter.changed
+    else:
+        # Copies kept from an earlier run count as well
+        fixed_copy = auto_fixes_enabled(app_config) and (app_config.output_directory / mission_name).exists()
+
+    mission_report = validate_mission(mission_data, catalog, app_config)
+    if app_config.incremental:
+        mission_report = replace(mission_report, source=mission_file.fingerprint(), fixed_copy=fixed_copy)
+    logger.info("Finished mission %s", mission_name)
+    return mission_report
+
+
+@timed("validate_mission")
+def validate_mission(
+    mission_data: MissionData,
+    catalog: AssetCatalog,
+    app_config: AppSettings,
+) -> MissionReport:
+    """Run every check on parsed mission data and record the findings."""
+
+    mission_name = mission_data.path.name
+    missing_map: str | None = None
+    findings = FindingRecorder(mission_name)
+
+    if mission_data.map_name:
+        count("catalog lookups")
+        if not catalog.has_map(mission_data.map_name):
+            missing_map = mission_data.map_name
+            findings.add(Category.MISSING_MAP, missing_map, Severity.ERROR)
+
+    if not (mission_data.date and mission_data.date_is_custom):
+        findings.add(Category.MISSION_DATE_NOT_SET, "", Severity.WARNING)
+
+    log_used_aircrafts(mission_data.aircraft, app_config.report_format, findings)
+    log_squadrons(mission_data.wing_sections, app_config.report_format, findings)
+    log_chiefs(mission_data.chiefs, catalog, app_config.report_format, findings)
+    log_stationaries(mission_data.stationaries, catalog, app_config.report_format, findings)
+    missing_aircrafts = log_planes_details(mission_data.aircraft, catalog, findings)
+    log_planes_without_markings(mission_data.stat_planes_without_markings, findings)
+    log_missing_squadrons(mission_data.wing_sections, catalog, findings)
+    missing_objects = log_buildings(mission_data.buildings, catalog, findings)
+
+    return MissionReport(
+        mission_name=mission_name,
+        mission_data=mission_data,
+        missing_map=missing_map,
+        missing_objects=frozenset(missing_objects),
+        missing_aircrafts=frozenset(missing_aircrafts),
+        findings=tuple(findings.findings),
+        full_report=app_config.report_format,
+    )
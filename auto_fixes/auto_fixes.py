@@ -0,0 +1,335 @@
+"""Auto-fix rules applied while a mission is streamed.
+
+Each rule declares the sections whose lines it rewrites. The rules enabled in
+the settings are compiled once, and :class:`AutoFixRewriter` hands every line
+of the mission only to the rules interested in its section, in the single
+pass that also parses the mission. Adding a fix means adding a rule class to
+:data:`FIX_RULES`.
+"""
+
+import functools
+import io
+import logging
+import os
+
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+from config.app_settings import AppSettings
+from conversions.static_conversions import ConversionMatcher
+from instrumentation.instrumentation import count
+from missions.missions import MissionDataBuilder
+from missions.tokenizer import MissionLine
+from resources.text_decoding import LEGACY_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FixContext:
+    """State of the mission being rewritten, shared with the rules.
+
+    ``section_line`` is the position of the line in its section, the
+    ``[Section]`` header being line 0.
+    """
+
+    mission_name: str
+    builder: MissionDataBuilder | None = None
+    section: str = ""
+    section_line: int = 0
+
+
+class FixRule(ABC):
+    """One auto-fix, enabled by a setting."""
+
+    name = ""
+    # Lowercase names of the sections whose lines the rule rewrites, None for every section
+    sections: frozenset[str] | None = None
+
+    @classmethod
+    @abstractmethod
+    def from_settings(cls, app_config: AppSettings, conversions: ConversionMatcher | None) -> "FixRule | None":
+        """Return the compiled rule, or None when it is disabled."""
+
+    def enters_section(self, context: FixContext) -> bool:
+        """Return True when the lines of ``context.section``, just opened, go to the rule."""
+        return self.sections is None or context.section.lower() in self.sections
+
+    @abstractmethod
+    def fix(self, line: str, context: FixContext) -> str:
+        """Return the fixed ``line``, preceded by the lines inserted before it."""
+
+
+class NonPlayerOnlyAIRule(FixRule):
+    """Make every flight but the player's AI-only, so co-op selection lists only the player flight."""
+
+    name = "only_ai"
+
+    @classmethod
+    def from_settings(cls, app_config: AppSettings, conversions: ConversionMatcher | None) -> FixRule | None:
+        return cls() if app_config.make_non_player_ai_only else None
+
+    def enters_section(self, context: FixContext) -> bool:
+        builder = context.builder
+        if builder is None:
+            # Lines before the first header are not in a wing section
+            return False
+        # The wing sections follow the [Wing] list, so they are all known here
+        return context.section in builder.wing_sections and context.section != builder.player_squadron
+
+    def fix(self, line: str, context: FixContext) -> str:
+        # OnlyAI goes before the second line of the wing section
+        if context.section_line == 2 and "OnlyAI" not in line:
+            count("auto-fix changes")
+            logger.debug("Mission %s auto-fix set OnlyAI=1 for %s", context.mission_name, context.section)
+            return "  OnlyAI 1\n" + line
+        return line
+
+
+class StationaryConversionRule(FixRule):
+    """Replace the objects listed in the conversion file, e.g. HSFX paths by their BAT equivalent."""
+
+    name = "conversions"
+
+    def __init__(self, conversions: ConversionMatcher) -> None:
+        self.conversions = conversions
+
+    @classmethod
+    def from_settings(cls, app_config: AppSettings, conversions: ConversionMatcher | None) -> FixRule | None:
+        if not app_config.auto_replace_stationary_objects or conversions is None:
+            return None
+        return cls(conversions)
+
+    def fix(self, line: str, context: FixContext) -> str:
+        line, replaced = self.conversions.replace(line)
+        count("auto-fix changes", len(replaced))
+        for item, replacement in replaced:
+            logger.debug("Mission %s auto-fix replaced %s with %s", context.mission_name, item, replacement)
+        return line
+
+
+class StaticMarkingsRule(FixRule):
+    """
+    Turn on the markings of the static planes saved without them.
+
+    v4.12
+    0_Static vehicles.planes.Plane$FI_156 2 149717.88 104298.02 254.10 0.0 null 1 1.0 null 1 // marked
+    1_Static vehicles.planes.Plane$FI_156 2 149729.30 104308.02 254.10 0.0 null 1 1.0 null 0 // unmarked
+
+    v4.10
+    0_Static vehicles.planes.Plane$FI_156 2 149924.42 104187.64 360.00 0.0 null
+    1_Static vehicles.planes.Plane$FI_156 0 149930.66 104206.04 360.00 0.0 nn
+    """
+
+    name = "static_markings"
+    sections = frozenset({"nstationary"})
+
+    @classmethod
+    def from_settings(cls, app_config: AppSettings, conversions: ConversionMatcher | None) -> FixRule | None:
+        return cls() if app_config.auto_correct_static_markings else None
+
+    def fix(self, line: str, context: FixContext) -> str:
+        if "vehicles.planes" not in line:
+            return line
+        line_data = line.split()
+        if len(line_data) >= 2:
+            if line_data[-1] == "0" and line_data[-2].lower() == "null":
+                line = line.rstrip()[:-1] + "1\n"
+                count("auto-fix changes")
+                logger.debug("Mission %s auto-fix corrected markings for %s", context.mission_name, line_data[1])
+            elif line_data[-1].lower() == "null":
+                line = line.rstrip() + " 1\n"
+                count("auto-fix changes")
+                logger.debug("Mission %s auto-fix appended markings for %s", context.mission_name, line_data[1])
+        return line
+
+
+# Rules in the order they are applied to a line
+FIX_RULES: tuple[type[FixRule], ...] = (
+    NonPlayerOnlyAIRule,
+    StationaryConversionRule,
+    StaticMarkingsRule,
+)
+
+
+@functools.lru_cache(maxsize=16)
+def compile_fix_rules(app_config: AppSettings, conversions: ConversionMatcher | None) -> tuple[FixRule, ...]:
+    """Return the rules enabled in the settings, compiled once per configuration."""
+
+    rules = []
+    for rule_class in FIX_RULES:
+        rule = rule_class.from_settings(app_config, conversions)
+        if rule is not None:
+            rules.append(rule)
+    logger.debug("Auto-fix rules: %s", ", ".join(rule.name for rule in rules) or "none")
+    return tuple(rules)
+
+
+def _has_contents(path: Path, contents: bytes) -> bool:
+    try:
+        # The size tells most changed copies apart without reading them
+        return path.stat().st_size == len(contents) and path.read_bytes() == contents
+    except FileNotFoundError:
+        return False
+
+
+def auto_fixes_enabled(app_config: AppSettings) -> bool:
+    """Return True when any auto-fix is enabled, so fixed copies of the missions are made."""
+    return (
+        app_config.auto_correct_static_markings
+        or app_config.auto_replace_stationary_objects
+        or app_config.make_non_player_ai_only
+    )
+
+
+class AutoFixRewriter:
+    """Build the auto-fixed copy of a mission while its lines are streamed.
+
+    The rewriter is fed the same line events as the mission builder, right
+    after the builder, so the player squadron and the wings registered so far
+    are known when a wing section starts. The rules interested in a section
+    are looked up once, on its header; lines of sections no rule touches are
+    copied as they are.
+
+    The copy is kept in memory and written on exit, in the encoding of the
+    mission, only when a rule changed it and it differs from the existing
+    output. It is written to a temporary file replacing the output at once, so
+    an interrupted run never leaves a partial mission behind.
+    """
+
+    def __init__(self, mission_name: str, output_path: Path, rules: tuple[FixRule, ...]) -> None:
+        self.mission_name = mission_name
+        self.output_path = output_path
+        self.rules = rules
+        self.mission_copy = io.StringIO()
+        self.changed = False
+        self._context = FixContext(mission_name)
+        # Lines before the first header belong to the unnamed section
+        self._active_rules = tuple(rule for rule in rules if rule.enters_section(self._context))
+
+    def __enter__(self) -> "AutoFixRewriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # A mission that failed to parse keeps its previous output
+        if exc_type is None:
+            self.save()
+
+    def feed(self, event: MissionLine, builder: MissionDataBuilder) -> None:
+        """Fix one line and add it to the mission copy."""
+
+        context = self._context
+        if event.is_header:
+            context.builder = builder
+            context.section = event.section
+            context.section_line = 0
+            self._active_rules = tuple(rule for rule in self.rules if rule.enters_section(context))
+        else:
+            context.section_line += 1
+
+        line = event.raw_line
+        for rule in self._active_rules:
+            line = rule.fix(line, context)
+        if line != event.raw_line:
+            self.changed = True
+        self.mission_copy.write(line)
+
+    def _encoded_copy(self) -> bytes | None:
+        builder = self._context.builder
+        encoding = builder.encoding if builder is not None else "utf-8"
+        text = self.mission_copy.getvalue()
+        if os.linesep != "\n":
+            # Same line endings as a file written in text mode
+            text = text.replace("\n", os.linesep)
+        try:
+            return text.encode(encoding, errors=LEGACY_ERRORS)
+        except UnicodeEncodeError as error:
+            # A replacement the mission encoding can not hold: writing it would lose text
+            logger.warning(
+                "Auto-fixed copy of mission %s not written: %r can not be encoded as %s",
+                self.mission_name,
+                error.object[error.start : error.end],
+                encoding,
+            )
+            return None
+
+    def save(self) -> bool:
+        """Write the fixed copy when it changed; return True when the output was written."""
+
+        output_path = self.output_path
+        if not self.changed:
+            if output_path.exists():
+                # Probably left by an earlier run, but it is not removed: it may not come from the analyzer
+                logger.warning(
+                    "Kept %s, although no auto-fix applies to mission %s any more", output_path, self.mission_name
+                )
+            else:
+                logger.debug("No auto-fix applies to mission %s", self.mission_name)
+            count("auto-fixed missions unchanged")
+            return False
+
+        contents = self._encoded_copy()
+        if contents is None:
+            count("auto-fixed missions unchanged")
+            return False
+        if _has_contents(output_path, contents):
+            logger.debug("Auto-fixed copy of mission %s is up to date at %s", self.mission_name, output_path)
+            count("auto-fixed missions unchanged")
+            return False
+
+        temporary_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            temporary_path.write_bytes(contents)
+            os.replace(temporary_path, output_path)
+        except OSError:
+            temporary_path.unlink(missing_ok=True)
+            raise
+        logger.debug("Auto-fixed copy of mission %s written to %s", self.mission_name, output_path)
+        count("auto-fixed missions written")
+        return True
+
+
+def open_auto_fix_rewriter(
+    stack: ExitStack,
+    mission_path: Path,
+    app_config: AppSettings,
+    conversions: ConversionMatcher | None,
+) -> AutoFixRewriter | None:
+    """Return the rewriter of the mission when any auto-fix is enabled.
+
+    The fixed copy is written when ``stack`` closes without an error. An
+    existing copy is kept unless ``overwrite_auto_fixes`` is enabled.
+    """
+
+    mission_name = mission_path.name
+    if not auto_fixes_enabled(app_config):
+        logger.debug("Auto-fixes disabled for mission %s", mission_name)
+        return None
+
+    output_mission_path = app_config.output_directory / mission_name
+    if output_mission_path.resolve() == mission_path.resolve():
+        logger.warning(
+            "Skipped auto-fixes for %s, the output folder is the campaign folder and the mission would be replaced",
+            mission_name,
+        )
+        return None
+    if not app_config.overwrite_auto_fixes and output_mission_path.exists():
+        logger.info(
+            "Skipped auto-fixes for %s, output already exists at %s (OVERWRITE_AUTO_FIXES=1 refreshes it)",
+            mission_name,
+            output_mission_path,
+        )
+        return None
+
+    logger.debug("Applying auto-fixes for mission %s", mission_name)
+    return stack.enter_context(
+        AutoFixRewriter(mission_name, output_mission_path, compile_fix_rules(app_config, conversions))
+    )
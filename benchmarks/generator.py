@@ -0,0 +1,273 @@
+"""Generate synthetic STD installations and campaigns for benchmarking.
+
+The files follow the layouts the loaders and the mission parser expect, with a
+configurable share of references to assets that do not exist so the
+"missing" code paths are exercised too.
+"""
+
+import argparse
+import random
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from config.app_settings import AppSettings
+
+
+@dataclass(frozen=True)
+class StdSize:
+    """Number of entries of each synthetic STD resource (BAT-sized by default)."""
+
+    aircraft: int = 300
+    skins_per_aircraft: int = 4
+    weapons_per_aircraft: int = 8
+    objects: int = 8400
+    stationaries: int = 2000
+    chiefs: int = 500
+    squadrons: int = 500
+    maps: int = 100
+
+
+@dataclass(frozen=True)
+class CampaignSize:
+    """Shape of the synthetic campaign."""
+
+    missions: int = 20
+    wings: int = 12
+    chiefs: int = 20
+    stationaries: int = 150
+    buildings: int = 300
+    # Share of mission references that point to assets missing from the STD
+    missing_ratio: float = 0.05
+
+
+def _aircraft_code(index: int) -> str:
+    return f"AC_{index:04d}"
+
+
+def _aircraft_name(index: int) -> str:
+    return f"Aircraft-{index:04d}"
+
+
+def _squadron(index: int) -> str:
+    return f"sq{index:04d}"
+
+
+def generate_std(root: Path, size: StdSize, seed: int = 0) -> None:
+    """Write the STD tree (air.ini, static.ini, ...), the maps and the skins under ``root``."""
+
+    rng = random.Random(seed)
+    objects_dir = root / "STD" / "com" / "maddox" / "il2" / "objects"
+    i18n_dir = root / "STD" / "i18n"
+    maps_dir = root / "MAPMODS" / "Maps"
+    for directory in (objects_dir, i18n_dir, maps_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with (objects_dir / "air.ini").open("w", encoding="utf-8") as handle:
+        handle.write("[AIR]\n// Synthetic aircraft list\n")
+        for index in range(size.aircraft):
+            handle.write(f"{_aircraft_name(index)}    air.{_aircraft_code(index)}    1    NOINFO\n")
+
+    with (i18n_dir / "weapons.properties").open("w", encoding="utf-8") as handle:
+        handle.write("# Synthetic loadouts\n")
+        for index in range(size.aircraft):
+            for weapon in range(size.weapons_per_aircraft):
+                handle.write(f"{_aircraft_name(index)}.loadout{weapon}    Loadout {weapon}\n")
+            handle.write(f"{_aircraft_name(index)}.default    Default\n")
+
+    with (objects_dir / "static.ini").open("w", encoding="utf-8") as handle:
+        handle.write("//===========================================================================\n")
+        for index in range(size.objects):
+            handle.write(
+                f"[buildings.House$Object{index:05d}]\n"
+                f"Title           Object{index:05d}\n"
+                f"MeshLive        3do/Buildings/Object{index:05d}/live.sim\n"
+                f"MeshDead        3do/Buildings/Object{index:05d}/dead.sim\n"
+                f"AlignToLand     {rng.randint(0, 1)}\n"
+                "Body            WoodSmall\n"
+                f"Panzer          {rng.random():.3f}\n\n"
+            )
+
+    with (objects_dir / "stationary.ini").open("w", encoding="utf-8") as handle:
+        handle.write("[StationaryObjects]\n// Synthetic stationaries\n")
+        for index in range(size.stationaries):
+            handle.write(f"stat{index:05d}    vehicles.stationary.Stationary$Stat{index:05d}    1\n")
+
+    with (objects_dir / "chief.ini").open("w", encoding="utf-8") as handle:
+        for index in range(size.chiefs):
+            handle.write(f"[Armor.{index}-Column]\n    moveType VEHICLE\n    Armor.{index}-Column\n")
+
+    with (i18n_dir / "regInfo.properties").open("w", encoding="utf-8") as handle:
+        handle.write("// Synthetic squadrons\n")
+        for index in range(size.squadrons):
+            handle.write(f"{_squadron(index)}    Squadron {index}\n")
+
+    with (maps_dir / "all.ini").open("w", encoding="utf-8") as handle:
+        handle.write("[all]\n")
+        for index in range(size.maps):
+            handle.write(f"Map{index:03d}    Map{index:03d}/load.ini\n")
+
+    skins_dir = root / "PaintSchemes" / "Skins"
+    for index in range(size.aircraft):
+        aircraft_dir = skins_dir / _aircraft_name(index)
+        aircraft_dir.mkdir(parents=True, exist_ok=True)
+        for skin in range(size.skins_per_aircraft):
+            (aircraft_dir / f"skin{skin}.bmp").touch()
+
+
+def _mission_text(rng: random.Random, std: StdSize, campaign: CampaignSize) -> str:
+    def _pick(count: int) -> tuple[int, bool]:
+        missing = rng.random() < campaign.missing_ratio
+        return (count + rng.randint(0, 999) if missing else rng.randrange(count)), missing
+
+    map_index, _ = _pick(std.maps)
+    wings = []
+    for _ in range(campaign.wings):
+        squadron, _ = _pick(std.squadrons)
+        wings.append(f"{_squadron(squadron)}{rng.randint(0, 3)}{rng.randint(0, 3)}")
+    wings = list(dict.fromkeys(wings))
+
+    lines = [
+        "[MAIN]",
+        f"  MAP Map{map_index:03d}/load.ini",
+        f"  TIME {rng.uniform(5, 19):.1f}",
+        "  CloudType 1",
+        "  CloudHeight 1500.0",
+        "  army 1",
+        "  playerNum 0",
+        f"  player {wings[0]}",
+        "[SEASON]",
+        f"  Year {rng.randint(1939, 1945)}",
+        f"  Month {rng.randint(1, 12)}",
+        f"  Day {rng.randint(1, 28)}",
+        "[WEATHER]",
+        "  WindDirection 0.0",
+        "  WindSpeed 0.0",
+        "  Gust 0",
+        "  Turbulence 0",
+        "[Wing]",
+    ]
+    lines.extend(f"  {wing}" for wing in wings)
+
+    for wing in wings:
+        aircraft, _ = _pick(std.aircraft)
+        loadout = "default" if rng.random() < 0.5 else f"loadout{rng.randint(0, std.weapons_per_aircraft)}"
+        lines.extend([
+            f"[{wing}]",
+            f"  Planes {rng.randint(1, 4)}",
+            f"  Skill {rng.randint(0, 3)}",
+            f"  Class air.{_aircraft_code(aircraft)}",
+            "  Fuel 100",
+            f"  weapons {loadout}",
+            f"  skin0 skin{rng.randint(0, std.skins_per_aircraft)}.bmp",
+            f"[{wing}_Way]",
+        ])
+        for waypoint in ("TAKEOFF", "NORMFLY", "NORMFLY", "LANDING"):
+            lines.append(
+                f"  {waypoint} {rng.uniform(0, 200000):.2f} {rng.uniform(0, 200000):.2f} "
+                f"{rng.uniform(0, 5000):.2f} {rng.uniform(200, 500):.2f} &0"
+            )
+
+    lines.append("[Chiefs]")
+    for index in range(campaign.chiefs):
+        chief, _ = _pick(std.chiefs)
+        lines.append(f"  {index}_Chief Armor.{chief}-Column {rng.randint(1, 2)}")
+    for index in range(campaign.chiefs):
+        lines.append(f"[{index}_Chief_Road]")
+        lines.append(f"  {rng.uniform(0, 200000):.2f} {rng.uniform(0, 200000):.2f} 120.00 0 2 1.0")
+
+    lines.append("[NStationary]")
+    for index in range(campaign.stationaries):
+        position = f"{rng.uniform(0, 200000):.2f} {rng.uniform(0, 200000):.2f} {rng.uniform(0, 360):.2f} 0.0"
+        if index % 10 == 0:
+            tail = rng.choice(["null", "null 0", "null 1"])
+            lines.append(f"  {index}_Static vehicles.planes.Plane${_aircraft_code(rng.randrange(std.aircraft))} 1 {position} {tail}")
+        else:
+            stationary, _ = _pick(std.stationaries)
+            lines.append(f"  {index}_Static vehicles.stationary.Stationary$Stat{stationary:05d} {rng.randint(1, 2)} {position}")
+
+    lines.append("[Buildings]")
+    for index in range(campaign.buildings):
+        building, _ = _pick(std.objects)
+        lines.append(
+            f"  {index}_bld House$Object{building:05d} 1 "
+            f"{rng.uniform(0, 200000):.2f} {rng.uniform(0, 200000):.2f} {rng.uniform(0, 360):.2f}"
+        )
+    lines.extend(["[Bridge]", "[House]"])
+    return "\n".join(lines) + "\n"
+
+
+def generate_campaign(campaign_dir: Path, std: StdSize, campaign: CampaignSize, seed: int = 0) -> list[Path]:
+    """Write ``campaign.ini`` and the mission files; return the mission paths."""
+
+    rng = random.Random(seed)
+    campaign_dir.mkdir(parents=True, exist_ok=True)
+    mission_paths = [campaign_dir / f"mission{index:04d}.mis" for index in range(campaign.missions)]
+
+    with (campaign_dir / "campaign.ini").open("w", encoding="utf-8") as handle:
+        handle.write("[Main]\n  class com.maddox.il2.game.campaign.CampaignDGen\n[list]\n")
+        for mission_path in mission_paths:
+            handle.write(f"  {mission_path.name}\n")
+
+    for mission_path in mission_paths:
+        mission_path.write_text(_mission_text(rng, std, campaign), encoding="utf-8")
+    return mission_paths
+
+
+def generate_environment(
+    root: Path,
+    std: StdSize | None = None,
+    campaign: CampaignSize | None = None,
+    seed: int = 0,
+) -> AppSettings:
+    """Generate an STD tree and a campaign under ``root`` and return matching settings."""
+
+    std = std or StdSize()
+    campaign = campaign or CampaignSize()
+    generate_std(root, std, seed)
+    generate_campaign(root / "Campaign", std, campaign, seed)
+
+    output_directory = root / "output"
+    return AppSettings(
+        std_path=root / "STD",
+        skin_path=root / "PaintSchemes" / "Skins",
+        campaign_path=root / "Campaign",
+        maps_path_folder=root / "MAPMODS",
+        output_directory=output_directory,
+        output_path=output_directory / "CampaignAnalyzerOutput.txt",
+        auto_correct_static_markings=True,
+        auto_replace_stationary_objects=True,
+        make_non_player_ai_only=True,
+        report_format=False,
+    )
+
+
+def main() -> None:
+    """Generate a synthetic environment from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("destination", type=Path)
+    parser.add_argument("--missions", type=int, default=CampaignSize.missions)
+    parser.add_argument("--wings", type=int, default=CampaignSize.wings)
+    parser.add_argument("--chiefs", type=int, default=CampaignSize.chiefs)
+    parser.add_argument("--stationaries", type=int, default=CampaignSize.stationaries)
+    parser.add_argument("--buildings", type=int, default=CampaignSize.buildings)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    settings = generate_environment(
+        arguments.destination,
+        campaign=CampaignSize(
+            missions=arguments.missions,
+            wings=arguments.wings,
+            chiefs=arguments.chiefs,
+            stationaries=arguments.stationaries,
+            buildings=arguments.buildings,
+        ),
+        seed=arguments.seed,
+    )
+    print(settings)
+
+
+if __name__ == "__main__":
+    main()
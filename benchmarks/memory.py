@@ -0,0 +1,124 @@
+"""Measure the memory held by the parsed missions of synthetic campaigns.
+
+Example::
+
+    python -m benchmarks.memory --missions 100 500 --output memory.json
+
+Every mission of the campaign is parsed and kept in memory, as the
+campaign-wide summaries do, and the memory still allocated afterwards is
+measured with tracemalloc, once for the parsed mission data and once for
+the mission reports built from it.
+"""
+
+import argparse
+import gc
+import io
+import json
+import logging
+import platform
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+from contextlib import ExitStack, redirect_stdout
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from analyzer.analyzer import validate_mission
+from benchmarks.generator import CampaignSize, StdSize, generate_environment
+from catalog.catalog import load_catalog
+from config.app_settings import AppSettings
+from missions.missions import read_mission, read_missions
+
+logger = logging.getLogger(__name__)
+
+
+def _allocated() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure_campaign(app_config: AppSettings) -> dict[str, Any]:
+    """Return the bytes held by the parsed missions and the reports of a campaign."""
+
+    catalog = load_catalog(app_config)
+    mission_list = read_missions(app_config.campaign_path)
+
+    tracemalloc.start()
+    try:
+        baseline = _allocated()
+        missions = [read_mission(mission_path) for mission_path in mission_list]
+        mission_data_bytes = _allocated() - baseline
+
+        with redirect_stdout(io.StringIO()):
+            reports = [validate_mission(mission_data, catalog, app_config) for mission_data in missions]
+        report_bytes = _allocated() - baseline - mission_data_bytes
+    finally:
+        tracemalloc.stop()
+
+    mission_count = len(reports)
+    return {
+        "mission_data_bytes": mission_data_bytes,
+        "mission_data_bytes_per_mission": mission_data_bytes // mission_count,
+        "report_bytes": report_bytes,
+        "report_bytes_per_mission": report_bytes // mission_count,
+    }
+
+
+def main() -> None:
+    """Run the memory benchmark from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--wings", type=int, default=CampaignSize.wings)
+    parser.add_argument("--stationaries", type=int, default=CampaignSize.stationaries)
+    parser.add_argument("--buildings", type=int, default=CampaignSize.buildings)
+    parser.add_argument("--workdir", type=Path, help="Keep the generated files in this folder")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
+    campaign_template = CampaignSize(
+        wings=arguments.wings,
+        stationaries=arguments.stationaries,
+        buildings=arguments.buildings,
+    )
+
+    results = []
+    with ExitStack() as stack:
+        workdir = arguments.workdir or Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        for mission_count in arguments.missions:
+            campaign_size = replace(campaign_template, missions=mission_count)
+            environment = workdir / f"campaign-{mission_count}"
+            shutil.rmtree(environment, ignore_errors=True)
+            logger.warning("Generating %d missions in %s", mission_count, environment)
+            app_config = generate_environment(environment, StdSize(), campaign_size)
+
+            measured = measure_campaign(app_config)
+            results.append({"missions": mission_count, "campaign": asdict(campaign_size), "bytes": measured})
+            logger.warning(
+                "%d missions | %s",
+                mission_count,
+                " ".join(f"{name}={value}" for name, value in measured.items()),
+            )
+
+    encoded = json.dumps(
+        {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if arguments.output is not None:
+        arguments.output.write_text(encoded + "\n", encoding="utf-8")
+    else:
+        print(encoded)
+
+
+if __name__ == "__main__":
+    main()
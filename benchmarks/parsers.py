@@ -0,0 +1,116 @@
+"""Compare the text and the memory-mapped parsers of static.ini.
+
+Example::
+
+    python -m benchmarks.parsers --scale 1 10 --repeat 5 --output parsers.json
+
+``--scale`` multiplies the BAT-sized number of static objects of the
+synthetic STD. Both parsers run on the same file and must return the same
+result. stationary.ini has no memory-mapped parser: every line of it is an
+entry, so searching the raw bytes measured slower than the text parser.
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import platform
+import shutil
+import sys
+import tempfile
+
+from collections.abc import Callable
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TextIO
+
+from benchmarks.generator import StdSize, generate_std
+from benchmarks.runner import _best_of
+from objects.objects import _parse_objects, _parse_objects_mapped
+from resources.text_decoding import open_text
+
+logger = logging.getLogger(__name__)
+
+OBJECTS_DIRECTORY = ("STD", "com", "maddox", "il2", "objects")
+
+
+def _run_text(parser: Callable[[TextIO], Any], path: Path) -> Any:
+    handle, _ = open_text(path)
+    with handle:
+        return parser(handle)
+
+
+def _run_mapped(parser: Callable[[mmap.mmap, Path], Any], path: Path) -> Any:
+    with path.open("rb") as raw_handle, mmap.mmap(raw_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return parser(mapped, path)
+
+
+def benchmark_parsers(std_root: Path, repeat: int) -> dict[str, Any]:
+    """Time both parsers of the static.ini under ``std_root``."""
+
+    path = std_root.joinpath(*OBJECTS_DIRECTORY, "static.ini")
+    text_seconds, text_result = _best_of(repeat, lambda: _run_text(_parse_objects, path))
+    mapped_seconds, mapped_result = _best_of(repeat, lambda: _run_mapped(_parse_objects_mapped, path))
+    if text_result != mapped_result:
+        raise AssertionError(f"The parsers of {path} disagree")
+    return {
+        "bytes": path.stat().st_size,
+        "entries": len(text_result),
+        "text_seconds": text_seconds,
+        "mapped_seconds": mapped_seconds,
+        "speedup": text_seconds / mapped_seconds,
+    }
+
+
+def main() -> None:
+    """Run the parser benchmark from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workdir", type=Path, help="Keep the generated files in this folder")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
+
+    results = []
+    with ExitStack() as stack:
+        workdir = arguments.workdir or Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        for scale in arguments.scale:
+            std_size = StdSize(aircraft=1, squadrons=1, maps=1, objects=StdSize.objects * scale)
+            environment = workdir / f"std-x{scale}"
+            shutil.rmtree(environment, ignore_errors=True)
+            logger.warning("Generating an STD %d times the BAT size in %s", scale, environment)
+            generate_std(environment, std_size)
+
+            measured = benchmark_parsers(environment, arguments.repeat)
+            results.append({"scale": scale, "static": measured})
+            logger.warning(
+                "x%d static.ini | %d bytes text=%.4fs mapped=%.4fs speedup=%.1fx",
+                scale,
+                measured["bytes"],
+                measured["text_seconds"],
+                measured["mapped_seconds"],
+                measured["speedup"],
+            )
+
+    encoded = json.dumps(
+        {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": arguments.repeat,
+            "results": results,
+        },
+        indent=2,
+    )
+    if arguments.output is not None:
+        arguments.output.write_text(encoded + "\n", encoding="utf-8")
+    else:
+        print(encoded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Time every stage of the analyzer on synthetic campaigns of growing size.
+
+Example::
+
+    python -m benchmarks.runner --missions 10 100 300 --repeat 3 --output bench.json
+
+The JSON report holds the best time of each stage per size, so it can be
+compared between releases to spot regressions.
+"""
+
+import argparse
+import io
+import json
+import logging
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable
+from contextlib import ExitStack, redirect_stdout
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from analyzer.analyzer import validate_mission
+from auto_fixes.auto_fixes import open_auto_fix_rewriter
+from benchmarks.generator import CampaignSize, StdSize, generate_environment
+from catalog.catalog import load_catalog
+from config.app_settings import AppSettings
+from conversions.static_conversions import load_conversion_matcher
+from main import main as run_analyzer
+from missions.missions import read_mission, read_missions
+from report.report import generate_missing_objects_ini
+from report.writers import open_report_writers
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _best_of(repeat: int, stage: Callable[[], Any]) -> tuple[float, Any]:
+    """Run ``stage`` ``repeat`` times and return the best wall time and the last result."""
+
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = stage()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _reset_output(app_config: AppSettings) -> None:
+    shutil.rmtree(app_config.output_directory, ignore_errors=True)
+    app_config.output_directory.mkdir(parents=True)
+
+
+def benchmark_campaign(app_config: AppSettings, repeat: int) -> dict[str, float]:
+    """Time each pipeline stage on an existing environment."""
+
+    timings: dict[str, float] = {}
+    _reset_output(app_config)
+
+    timings["resource_load"], catalog = _best_of(repeat, lambda: load_catalog(app_config))
+    mission_list = read_missions(app_config.campaign_path)
+
+    timings["parse"], missions = _best_of(
+        repeat, lambda: [read_mission(mission_path) for mission_path in mission_list]
+    )
+    timings["validate"], reports = _best_of(
+        repeat, lambda: [validate_mission(mission_data, catalog, app_config) for mission_data in missions]
+    )
+
+    def _write_report() -> None:
+        missing_objects: set[str] = set()
+        with ExitStack() as stack:
+            writers = open_report_writers(stack, app_config)
+            for mission_report in reports:
+                for writer in writers:
+                    writer.write_mission(mission_report)
+                missing_objects |= mission_report.missing_objects
+        with redirect_stdout(io.StringIO()):
+            generate_missing_objects_ini(missing_objects, app_config.output_directory)
+
+    timings["report"], _ = _best_of(repeat, _write_report)
+
+    conversions = load_conversion_matcher(PROJECT_ROOT)
+
+    def _auto_fix() -> None:
+        for mission_path in mission_list:
+            (app_config.output_directory / mission_path.name).unlink(missing_ok=True)
+            with ExitStack() as stack:
+                rewriter = open_auto_fix_rewriter(stack, mission_path, app_config, conversions)
+                assert rewriter is not None
+                read_mission(mission_path, rewriter.feed)
+
+    timings["auto_fix"], _ = _best_of(repeat, _auto_fix)
+
+    def _end_to_end() -> None:
+        _reset_output(app_config)
+        with redirect_stdout(io.StringIO()):
+            run_analyzer(app_config)
+
+    timings["end_to_end"], _ = _best_of(repeat, _end_to_end)
+    return timings
+
+
+def run_benchmarks(
+    mission_counts: list[int],
+    repeat: int,
+    std_size: StdSize,
+    campaign_template: CampaignSize,
+    jobs: int,
+    workdir: Path,
+) -> dict[str, Any]:
+    """Generate one environment per mission count, time it and collect the results."""
+
+    results = []
+    for mission_count in mission_counts:
+        campaign_size = replace(campaign_template, missions=mission_count)
+        environment = workdir / f"campaign-{mission_count}"
+        shutil.rmtree(environment, ignore_errors=True)
+        logger.warning("Generating %d missions in %s", mission_count, environment)
+        app_config = replace(generate_environment(environment, std_size, campaign_size), jobs=jobs)
+
+        timings = benchmark_campaign(app_config, repeat)
+        mission_bytes = sum(path.stat().st_size for path in app_config.campaign_path.glob("*.mis"))
+        results.append({
+            "missions": mission_count,
+            "mission_bytes": mission_bytes,
+            "campaign": asdict(campaign_size),
+            "seconds": timings,
+        })
+        logger.warning(
+            "%d missions | %s",
+            mission_count,
+            " ".join(f"{stage}={seconds:.3f}s" for stage, seconds in timings.items()),
+        )
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "jobs": jobs,
+        "std": asdict(std_size),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks from the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=1, help="JOBS setting for the end-to-end stage")
+    parser.add_argument("--wings", type=int, default=CampaignSize.wings)
+    parser.add_argument("--chiefs", type=int, default=CampaignSize.chiefs)
+    parser.add_argument("--stationaries", type=int, default=CampaignSize.stationaries)
+    parser.add_argument("--buildings", type=int, default=CampaignSize.buildings)
+    parser.add_argument("--workdir", type=Path, help="Keep the generated files in this folder")
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file")
+    arguments = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.WARNING)
+    campaign_template = CampaignSize(
+        wings=arguments.wings,
+        chiefs=arguments.chiefs,
+        stationaries=arguments.stationaries,
+        buildings=arguments.buildings,
+    )
+
+    with ExitStack() as stack:
+        workdir = arguments.workdir or Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        results = run_benchmarks(
+            arguments.missions, arguments.repeat, StdSize(), campaign_template, arguments.jobs, workdir
+        )
+
+    encoded = json.dumps(results, indent=2)
+    if arguments.output is not None:
+        arguments.output.write_text(encoded + "\n", encoding="utf-8")
+    else:
+        print(encoded)
+
+
+if __name__ == "__main__":
+    main()
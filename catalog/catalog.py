@@ -0,0 +1,206 @@
+"""Hash-indexed catalog of the assets available in the standard installation."""
+
+import logging
+import time
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from aircraft.aircraft import read_aircrafts
+from chiefs.chiefs import read_chiefs
+from config.app_settings import AppSettings
+from instrumentation.instrumentation import timed
+from maps.maps import read_maps
+from objects.objects import read_objects
+from skins.skins import read_skins
+from squadrons.squadrons import read_squadrons
+from stationary.stationary import read_stationaries
+from weapons.weapons import read_weapons
+
+logger = logging.getLogger(__name__)
+
+# Static planes name their air.ini class instead of a stationary.ini entry:
+# vehicles.planes.Plane$FI_156
+PLANE_STATIONARY_PREFIX = "vehicles.planes.Plane$"
+
+
+def _fold(identifiers: Iterable[str]) -> frozenset[str]:
+    return frozenset(identifier.casefold() for identifier in identifiers)
+
+
+@dataclass(frozen=True)
+class AssetCatalog:
+    """Immutable lookup tables built once from the ``read_*`` loaders.
+
+    Every membership test is a hash lookup against a frozenset (or a dict of
+    frozensets). The ``*_folded`` sets hold the case-folded identifiers and back
+    the ``ignore_case`` variants of the ``has_*`` helpers. The dicts must be
+    treated as read-only; they are kept as plain dicts so the catalog can be
+    pickled for worker processes.
+    """
+
+    aircraft_classes: dict[str, str]
+    chiefs: frozenset[str]
+    skins: dict[str, frozenset[str]]
+    stationaries: dict[str, str]
+    objects: frozenset[str]
+    weapons: dict[str, frozenset[str]]
+    squadrons: frozenset[str]
+    maps: frozenset[str]
+    chiefs_folded: frozenset[str]
+    stationaries_folded: frozenset[str]
+    objects_folded: frozenset[str]
+    squadrons_folded: frozenset[str]
+    maps_folded: frozenset[str]
+
+    @classmethod
+    def from_resources(
+        cls,
+        *,
+        aircraft_classes: Mapping[str, str],
+        chiefs: Iterable[str],
+        skins: Mapping[str, Iterable[str]],
+        stationaries: Mapping[str, str],
+        objects: Iterable[str],
+        weapons: Mapping[str, Iterable[str]],
+        squadrons: Iterable[str],
+        maps: Iterable[str],
+    ) -> "AssetCatalog":
+        """Index the raw loader results."""
+
+        chief_set = frozenset(chiefs)
+        object_set = frozenset(objects)
+        squadron_set = frozenset(squadrons)
+        map_set = frozenset(maps)
+
+        return cls(
+            aircraft_classes=dict(aircraft_classes),
+            chiefs=chief_set,
+            skins={folder: frozenset(files) for folder, files in skins.items()},
+            stationaries=dict(stationaries),
+            objects=object_set,
+            weapons={aircraft: frozenset(codes) for aircraft, codes in weapons.items()},
+            squadrons=squadron_set,
+            maps=map_set,
+            chiefs_folded=_fold(chief_set),
+            stationaries_folded=_fold(stationaries),
+            objects_folded=_fold(object_set),
+            squadrons_folded=_fold(squadron_set),
+            maps_folded=_fold(map_set),
+        )
+
+    def aircraft_name(self, aircraft_code: str) -> str | None:
+        """Return the air.ini name for a class code, if the aircraft exists."""
+        return self.aircraft_classes.get(aircraft_code)
+
+    def skins_for(self, aircraft_name: str) -> frozenset[str]:
+        """Return the skin files available for an aircraft (folder match ignores case)."""
+        return self.skins.get(aircraft_name.lower(), frozenset())
+
+    def has_weapon(self, aircraft_name: str, weapon_code: str) -> bool:
+        """Check whether ``weapon_code`` is a known loadout for the aircraft."""
+        return weapon_code in self.weapons.get(aircraft_name, frozenset())
+
+    def has_chief(self, chief: str, ignore_case: bool = False) -> bool:
+        """Check whether a chief identifier exists."""
+        if ignore_case:
+            return chief.casefold() in self.chiefs_folded
+        return chief in self.chiefs
+
+    def has_stationary(self, stationary: str, ignore_case: bool = False) -> bool:
+        """Check whether a stationary class exists (static planes against air.ini)."""
+        if stationary.startswith(PLANE_STATIONARY_PREFIX):
+            return self.aircraft_name(stationary[len(PLANE_STATIONARY_PREFIX):]) is not None
+        if ignore_case:
+            return stationary.casefold() in self.stationaries_folded
+        return stationary in self.stationaries
+
+    def missing_stationaries(self, stationaries: frozenset[str]) -> frozenset[str]:
+        """Return the stationaries of a mission found neither in stationary.ini nor, for planes, in air.ini."""
+        planes = frozenset(
+            stationary for stationary in stationaries if stationary.startswith(PLANE_STATIONARY_PREFIX)
+        )
+        missing_planes = frozenset(plane for plane in planes if not self.has_stationary(plane))
+        # difference() checks each mission entry against the dict keys, without copying them to a set
+        return (stationaries - planes).difference(self.stationaries) | missing_planes
+
+    def has_object(self, building: str, ignore_case: bool = False) -> bool:
+        """Check whether a static object (building) exists."""
+        if ignore_case:
+            return building.casefold() in self.objects_folded
+        return building in self.objects
+
+    def has_squadron(self, squadron: str, ignore_case: bool = False) -> bool:
+        """Check whether a squadron is configured in regInfo.properties."""
+        if ignore_case:
+            return squadron.casefold() in self.squadrons_folded
+        return squadron in self.squadrons
+
+    def has_map(self, map_name: str, ignore_case: bool = False) -> bool:
+        """Check whether a map is listed in all.ini."""
+        if ignore_case:
+            return map_name.casefold() in self.maps_folded
+        return map_name in self.maps
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of entries per resource, for logging."""
+        return {
+            "aircraft": len(self.aircraft_classes),
+            "chiefs": len(self.chiefs),
+            "skins": len(self.skins),
+            "stationaries": len(self.stationaries),
+            "objects": len(self.objects),
+            "weapons": len(self.weapons),
+            "squadrons": len(self.squadrons),
+            "maps": len(self.maps),
+        }
+
+
+@timed("load_catalog")
+def load_catalog(app_config: AppSettings) -> AssetCatalog:
+    """Load every standard installation resource and index it.
+
+    The resources are read concurrently: the loaders mostly wait on the
+    (often slow) game drive, so the load takes about as long as the slowest
+    resource instead of the sum of all of them.
+    """
+
+    logger.info("Loading standard installation resources")
+    skins_cache = app_config.cache_directory if app_config.use_resource_cache else None
+    loaders: dict[str, Callable[[], Any]] = {
+        "aircraft_classes": lambda: read_aircrafts(app_config.std_path),
+        "chiefs": lambda: read_chiefs(app_config.std_path),
+        "skins": lambda: read_skins(app_config.skin_path, skins_cache),
+        "stationaries": lambda: read_stationaries(app_config.std_path),
+        "objects": lambda: read_objects(app_config.std_path),
+        "weapons": lambda: read_weapons(app_config.std_path),
+        "squadrons": lambda: read_squadrons(app_config.std_path),
+        "maps": lambda: read_maps(app_config.maps_path_folder),
+    }
+
+    def _timed_load(name: str) -> tuple[Any, float]:
+        started = time.perf_counter()
+        resource = loaders[name]()
+        return resource, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="resource-loader") as executor:
+        futures = {name: executor.submit(_timed_load, name) for name in loaders}
+        # result() re-raises the error of a failed loader, as the sequential load did
+        loaded = {name: future.result() for name, future in futures.items()}
+    elapsed = time.perf_counter() - started
+
+    logger.info(
+        "Resource load times | %s | wall=%.3fs",
+        " ".join(f"{name}={seconds:.3f}s" for name, (_, seconds) in loaded.items()),
+        elapsed,
+    )
+    catalog = AssetCatalog.from_resources(**{name: resource for name, (resource, _) in loaded.items()})
+
+    logger.info(
+        "Resource counts | %s",
+        " ".join(f"{name}={count}" for name, count in catalog.counts().items()),
+    )
+    return catalog
@@ -3,34 +3,33 @@
 from pathlib import Path
 from typing import Iterable, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 
-IGNORED_PREFIXES = (";", "[", "moveType", "/")
-
-def _iter_chief_lines(lines: Iterable[str]) -> Iterable[str]:
+def _iter_chief_sections(lines: Iterable[str]) -> Iterable[str]:
     for raw_line in lines:
         line = raw_line.strip()
-        if not line or line.startswith(IGNORED_PREFIXES):
-            continue
-        if line.startswith("[Ships."):
-            break
-        yield line
+        if line.startswith("[") and line.endswith("]") and len(line) > 2:
+            yield line[1:-1]
 
 
 def _parse_chiefs(handle: TextIO) -> list[str]:
-    chiefs: list[str] = []
-    for line in _iter_chief_lines(handle):
-        chiefs.append(line.split()[0])
-    return chiefs
+    return list(_iter_chief_sections(handle))
 
 
+@timed("read_chiefs")
 def read_chiefs(root: str | Path) -> list[str]:
-    """Return the chief identifiers defined before the ships section."""
+    """Return the chief identifiers (section names), the ships of the ShipPack part included.
+
+    Missions refer to a chief by its chief.ini section, e.g. ``Armor.1-BT7``
+    or ``Ships.Bismarck``.
+    """
 
     return load_resource(
         root,
         ("com", "maddox", "il2", "objects", "chief.ini"),
         _parse_chiefs,
         "chief definitions",
+        parser_version=2,
     )
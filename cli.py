@@ -1,4 +1,26 @@
-""" New console interface for the application using Typer. """
+""" New console interface for the application using Typer.
+
+Each command imports the modules it needs when it runs, so the other commands
+(and the help) start without loading the analyzer, the server or the watcher.
+"""
+import sys
+
+from instrumentation.startup import ImportTimer
+
+def _timing_requested(arguments: list[str]) -> bool:
+    """ True when --timing-startup is given before the command, where the callback accepts it. """
+    for argument in arguments:
+        if not argument.startswith("-"):
+            # The command name; its own options follow
+            return False
+        if argument == "--timing-startup":
+            return True
+    return False
+
+# Installed first, so every import below is timed as well
+_IMPORT_TIMER = ImportTimer.install() if _timing_requested(sys.argv[1:]) else None
+
+# pylint: disable=wrong-import-position,import-outside-toplevel
 from dataclasses import fields, replace
 from pathlib import Path
 from typing import Any
@@ -6,7 +28,6 @@ from typing import Any
 import typer
 
 from config.app_settings import AppSettings, read_app_settings
-from main import main as run_analyzer
 
 app = typer.Typer()
 _TRUE_VALUES = {"1", "true", "yes", "y"}
@@ -28,10 +49,29 @@ def _prompt_setting(settings: AppSettings, field_name: str) -> AppSettings:
     updated = _coerce_value(current, response)
     return replace(settings, **{field_name: updated})
 
-@app.command()
-def run() -> None:
-    """ Run the campaign analyzer with interactive settings. """
+def _load_settings(
+    jobs: int | None,
+    incremental: bool | None,
+    profile: bool,
+    profile_dump: bool,
+    report_outputs: str | None,
+    suggest_conversions: bool = False,
+    overwrite_fixes: bool = False,
+) -> AppSettings:
+    """ Read settings.ini, apply the command line overrides and let the user review them. """
     settings: AppSettings = read_app_settings()
+    if jobs is not None:
+        settings = replace(settings, jobs=jobs)
+    if incremental is not None:
+        settings = replace(settings, incremental=incremental)
+    if profile or profile_dump:
+        settings = replace(settings, profile=True, profile_dump=profile_dump or settings.profile_dump)
+    if report_outputs is not None:
+        settings = replace(settings, report_outputs=report_outputs)
+    if suggest_conversions:
+        settings = replace(settings, suggest_conversions=True)
+    if overwrite_fixes:
+        settings = replace(settings, overwrite_auto_fixes=True)
     typer.echo("Loaded settings:\n")
     for field in fields(settings):
         typer.echo(f"  {field.name}: {getattr(settings, field.name)}")
@@ -45,7 +85,156 @@ def run() -> None:
     if not typer.confirm("\nProceed with these settings?", default=True):
         typer.echo("Aborted.")
         raise typer.Exit(code=1)
-    run_analyzer(settings)
+    return settings
+
+_JOBS_OPTION = typer.Option(
+    None, "--jobs", "-j", help="Missions analyzed in parallel (0 = one per CPU)."
+)
+_INCREMENTAL_OPTION = typer.Option(
+    None, "--incremental/--full", help="Only re-validate the missions that changed."
+)
+_PROFILE_OPTION = typer.Option(False, "--profile", help="Print the time spent in each stage.")
+_PROFILE_DUMP_OPTION = typer.Option(
+    False, "--profile-dump", help="Also write cProfile statistics to the output folder."
+)
+_REPORT_OUTPUTS_OPTION = typer.Option(
+    None, "--report-outputs", help="Report files to write, comma separated: text, jsonl, csv."
+)
+_SUGGEST_CONVERSIONS_OPTION = typer.Option(
+    False, "--suggest-conversions", help="Write a draft conversions file for the missing objects."
+)
+_OVERWRITE_FIXES_OPTION = typer.Option(
+    False, "--overwrite-fixes", help="Refresh the auto-fixed missions already in the output folder."
+)
+
+def _startup_finished() -> None:
+    """ Print the import times once the modules of the command are loaded. """
+    if _IMPORT_TIMER is not None:
+        _IMPORT_TIMER.uninstall()
+        typer.echo(_IMPORT_TIMER.format_report(), err=True)
+
+@app.callback(invoke_without_command=True)
+def default(
+    ctx: typer.Context,
+    timing_startup: bool = typer.Option(  # pylint: disable=unused-argument
+        False, "--timing-startup", help="Print the time spent importing each module before the command runs."
+    ),
+) -> None:
+    """ Without a command, run the analyzer on the campaign of settings.ini. """
+    # The timer itself is installed on import, from sys.argv
+    if ctx.invoked_subcommand is None:
+        run(
+            jobs=None,
+            incremental=None,
+            profile=False,
+            profile_dump=False,
+            report_outputs=None,
+            suggest_conversions=False,
+            overwrite_fixes=False,
+        )
+
+@app.command()
+def run(
+    jobs: int | None = _JOBS_OPTION,
+    incremental: bool | None = _INCREMENTAL_OPTION,
+    profile: bool = _PROFILE_OPTION,
+    profile_dump: bool = _PROFILE_DUMP_OPTION,
+    report_outputs: str | None = _REPORT_OUTPUTS_OPTION,
+    suggest_conversions: bool = _SUGGEST_CONVERSIONS_OPTION,
+    overwrite_fixes: bool = _OVERWRITE_FIXES_OPTION,
+) -> None:
+    """ Run the campaign analyzer with interactive settings. """
+    from main import main as run_analyzer
+
+    _startup_finished()
+    run_analyzer(
+        _load_settings(
+            jobs, incremental, profile, profile_dump, report_outputs, suggest_conversions, overwrite_fixes
+        )
+    )
+
+@app.command()
+def batch(
+    campaigns_root: Path = typer.Argument(
+        ..., help="Folder searched for campaigns (every folder holding a campaign.ini)."
+    ),
+    jobs: int | None = _JOBS_OPTION,
+    incremental: bool | None = _INCREMENTAL_OPTION,
+    profile: bool = _PROFILE_OPTION,
+    profile_dump: bool = _PROFILE_DUMP_OPTION,
+    report_outputs: str | None = _REPORT_OUTPUTS_OPTION,
+    suggest_conversions: bool = _SUGGEST_CONVERSIONS_OPTION,
+    overwrite_fixes: bool = _OVERWRITE_FIXES_OPTION,
+) -> None:
+    """ Validate every campaign below a folder, loading the STD resources once. """
+    from main import main_batch as run_batch
+
+    _startup_finished()
+    run_batch(
+        campaigns_root,
+        _load_settings(
+            jobs, incremental, profile, profile_dump, report_outputs, suggest_conversions, overwrite_fixes
+        ),
+    )
+
+@app.command()
+def watch(
+    interval: float | None = typer.Option(
+        None, "--interval", help="Seconds between two checks of the campaign files [default: 0.25]."
+    ),
+) -> None:
+    """ Re-validate the missions of the campaign every time they are saved. """
+    from watch.watch import DEFAULT_POLL_INTERVAL, watch_campaign
+
+    _startup_finished()
+    settings = _load_settings(None, None, False, False, None)
+    try:
+        watch_campaign(settings, DEFAULT_POLL_INTERVAL if interval is None else interval)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+
+@app.command()
+def serve(
+    host: str | None = typer.Option(None, "--host", help="Address to listen on [default: 127.0.0.1]."),
+    port: int | None = typer.Option(None, "--port", help="Port to listen on [default: 8765]."),
+    jobs: int | None = _JOBS_OPTION,
+) -> None:
+    """ Start the local validation server (settings.ini is used as is, without prompts). """
+    from server.server import DEFAULT_HOST, DEFAULT_PORT, serve as run_server
+
+    _startup_finished()
+    settings = read_app_settings()
+    if jobs is not None:
+        settings = replace(settings, jobs=jobs)
+    try:
+        run_server(settings, host or DEFAULT_HOST, DEFAULT_PORT if port is None else port)
+    except KeyboardInterrupt:
+        typer.echo("Server stopped.")
+
+@app.command()
+def where(
+    name: str = typer.Argument(..., help="Asset name, e.g. House$Tent, BF_109G6 or a skin file."),
+) -> None:
+    """ List the missions using or missing an asset, from the index of the last run. """
+    from report.aggregation import INDEX_FILE_NAME, CampaignIndex
+
+    _startup_finished()
+    settings = read_app_settings()
+    index = CampaignIndex.load(settings.output_directory / INDEX_FILE_NAME)
+    if index is None:
+        raise typer.Exit(code=1)
+    using, reporting = index.find(name)
+    if not using and not reporting:
+        typer.echo(f"{name} is not used in the {len(index.missions)} missions of the last run")
+    for kind, missions in using.items():
+        typer.echo(f"Used as {kind} in {len(missions)} missions: {', '.join(missions)}")
+    for category, missions in reporting.items():
+        typer.echo(f"Reported as {category} in {len(missions)} missions: {', '.join(missions)}")
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+
+        # In a frozen executable, the worker processes start here and must not run the command
+        freeze_support()
     app()
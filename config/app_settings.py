@@ -23,6 +23,26 @@ class AppSettings:
     auto_replace_stationary_objects: bool
     make_non_player_ai_only: bool
     report_format: bool
+    use_resource_cache: bool = False
+    jobs: int = 1
+    incremental: bool = False
+    profile: bool = False
+    profile_dump: bool = False
+    report_outputs: str = "text"
+    suggest_conversions: bool = False
+    prefetch_depth: int = 4
+    prefetch_memory_mb: int = 64
+    overwrite_auto_fixes: bool = False
+
+    @property
+    def cache_directory(self) -> Path:
+        """Folder holding the cached, already parsed STD resources."""
+        return self.output_directory / ".cache"
+
+    @property
+    def profile_dump_path(self) -> Path:
+        """cProfile statistics of the run, readable with the pstats module."""
+        return self.output_directory / "CampaignAnalyzerProfile.pstats"
 
     def __str__(self) -> str:
         return f"\n\tSTD path: {self.std_path}" \
@@ -34,6 +54,16 @@ class AppSettings:
         f"\n\t - Replace Stationary objects: {'Yes' if self.auto_replace_stationary_objects else 'No'}" \
         f"\n\t - [Coop] Non player flights AI only: {'Yes' if self.make_non_player_ai_only else 'No'}" \
         f"\n\t - Report format: {'Reduced' if self.report_format else 'Full'}" \
+        f"\n\t - Cache parsed resources: {'Yes' if self.use_resource_cache else 'No'}" \
+        f"\n\t - Parallel jobs: {self.jobs if self.jobs > 0 else 'One per CPU'}" \
+        f"\n\t - Incremental (only changed missions): {'Yes' if self.incremental else 'No'}" \
+        f"\n\t - Profile stages: {'Yes' if self.profile else 'No'}" \
+        f"\n\t - cProfile dump: {'Yes' if self.profile_dump else 'No'}" \
+        f"\n\t - Report outputs: {self.report_outputs}" \
+        f"\n\t - Draft conversions for missing objects: {'Yes' if self.suggest_conversions else 'No'}" \
+        f"\n\t - Missions read ahead: {self.prefetch_depth if self.prefetch_depth > 0 else 'None'}" \
+        f" (up to {self.prefetch_memory_mb} MB)" \
+        f"\n\t - Refresh existing auto-fixed missions: {'Yes' if self.overwrite_auto_fixes else 'No'}" \
         f"\n\tReport: {self.output_path}"
 
 def read_app_settings() -> AppSettings:
@@ -78,7 +108,17 @@ def read_app_settings() -> AppSettings:
         auto_correct_static_markings=_flag("AUTO_CORRECT_STATIC_AIRCRAFT_MARKINGS"),
         auto_replace_stationary_objects=_flag("AUTO_REPLACE_STATIONARY_OBJECTS"),
         make_non_player_ai_only=_flag("NON_PLAYER_AI_ONLY"),
-        report_format=_flag("REPORT_FORMAT")
+        report_format=_flag("REPORT_FORMAT"),
+        use_resource_cache=_flag("RESOURCE_CACHE"),
+        jobs=section.getint("JOBS", fallback=1),
+        incremental=_flag("INCREMENTAL"),
+        profile=_flag("PROFILE"),
+        profile_dump=_flag("PROFILE_DUMP"),
+        report_outputs=section.get("REPORT_OUTPUTS", fallback="text").strip(),
+        suggest_conversions=_flag("SUGGEST_CONVERSIONS"),
+        prefetch_depth=section.getint("PREFETCH_DEPTH", fallback=4),
+        prefetch_memory_mb=section.getint("PREFETCH_MEMORY_MB", fallback=64),
+        overwrite_auto_fixes=_flag("OVERWRITE_AUTO_FIXES"),
     )
 
     logger.info(settings)
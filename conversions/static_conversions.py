@@ -1,12 +1,18 @@
 """Helpers for loading conversion mappings."""
 
 import logging
+import re
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Iterable
 
+from instrumentation.instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
+CONVERSIONS_FILE_NAME = "Common Conversions.txt"
+
 
 def _parse_conversion_line(line: str) -> tuple[str, str] | None:
     """Parse a conversion entry. Returns None for blank/comment lines."""
@@ -29,10 +35,11 @@ def _iter_conversion_entries(lines: Iterable[str]) -> Iterable[tuple[str, str]]:
             yield result
 
 
+@timed("read_conversion_file")
 def read_conversion_file(root: str | Path) -> dict[str, str]:
     """Read the common conversions from the conversion file."""
 
-    conversion_path = Path(root) / "config" / "Common Conversions.txt"
+    conversion_path = Path(root) / CONVERSIONS_FILE_NAME
     conversion_db: dict[str, str] = {}
 
     with conversion_path.open(encoding="utf-8") as handle:
@@ -42,3 +49,71 @@ def read_conversion_file(root: str | Path) -> dict[str, str]:
     logger.debug("Loaded %d conversion entries", len(conversion_db))
     logger.debug("Conversion entries: %s", conversion_db)
     return conversion_db
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation that shares common prefixes between ``words``.
+
+    Matching a trie-shaped pattern costs one character comparison per step,
+    whatever the number of words, instead of trying every word in turn.
+    """
+
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _build(node: dict[str, dict]) -> str:
+        is_word_end = "" in node
+        branches = [re.escape(char) + _build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # Greedy optional group: the longest source is tried first
+        return group + "?" if is_word_end else group
+
+    return _build(trie)
+
+
+class ConversionMatcher:
+    """Apply every conversion to a line with a single regex scan.
+
+    A source is replaced where it is followed by a blank, the same condition
+    the mission object lines have always been checked with.
+    """
+
+    def __init__(self, conversions: Mapping[str, str]) -> None:
+        self.conversions = dict(conversions)
+        self._pattern = (
+            re.compile(f"(?:{_trie_pattern(self.conversions)})(?= )") if self.conversions else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.conversions)
+
+    def replace(self, line: str) -> tuple[str, list[tuple[str, str]]]:
+        """Return the converted line and the ``(source, replacement)`` pairs applied."""
+
+        if self._pattern is None:
+            return line, []
+
+        applied: list[tuple[str, str]] = []
+
+        def _substitute(match: re.Match[str]) -> str:
+            source = match.group(0)
+            replacement = self.conversions[source]
+            applied.append((source, replacement))
+            return replacement
+
+        return self._pattern.sub(_substitute, line), applied
+
+
+def load_conversion_matcher(root: str | Path) -> ConversionMatcher:
+    """Read the conversion file once and compile it into a matcher."""
+
+    logger.debug("Loading conversion database from %s", root)
+    return ConversionMatcher(read_conversion_file(root))
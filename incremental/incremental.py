@@ -0,0 +1,281 @@
+"""Per-mission manifest used to re-validate only the missions that changed."""
+
+import hashlib
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import Any
+
+from analyzer.analyzer import MissionReport
+from auto_fixes.auto_fixes import auto_fixes_enabled
+from catalog.catalog import AssetCatalog
+from config.app_settings import AppSettings
+from conversions.static_conversions import ConversionMatcher
+from missions.mission_data import MissionAircraft, MissionData, MissionDate
+from report.findings import Category, Finding, Severity
+from report.report import convert_wing_to_reg
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "_campaign_manifest.json"
+# Bump when the report text or the checks change, so cached findings are dropped
+MANIFEST_VERSION = 6
+
+
+def content_hash(mission_path: Path) -> str:
+    """Return the SHA-256 of the mission file contents."""
+    with mission_path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def resource_fingerprint(mission_data: MissionData, catalog: AssetCatalog) -> str:
+    """Digest the catalog answers for every asset the mission references.
+
+    The digest only changes when an STD resource used by the mission changes
+    (an aircraft, skin or loadout appears or disappears, a building is added,
+    ...), so edits to unrelated resources keep the cached findings valid.
+    """
+
+    aircraft_answers = []
+    for aircraft in mission_data.aircraft:
+        aircraft_name = catalog.aircraft_name(aircraft.aircraft_code)
+        if aircraft_name is None:
+            aircraft_answers.append([aircraft.aircraft_code, None])
+            continue
+        aircraft_answers.append([
+            aircraft.aircraft_code,
+            aircraft_name,
+            sorted(aircraft.skins & catalog.skins_for(aircraft_name)),
+            catalog.has_weapon(aircraft_name, aircraft.weapon_code),
+        ])
+
+    answers = {
+        "map": catalog.has_map(mission_data.map_name) if mission_data.map_name else None,
+        "aircraft": aircraft_answers,
+        "squadrons": sorted(
+            wing for wing in mission_data.wing_sections
+            if catalog.has_squadron(convert_wing_to_reg(wing))
+        ),
+        "chiefs": sorted(chief for chief in mission_data.chiefs if catalog.has_chief(chief)),
+        "stationaries": sorted(
+            stationary for stationary in mission_data.stationaries
+            if catalog.has_stationary(stationary)
+        ),
+        "buildings": sorted(set(mission_data.buildings) & catalog.objects),
+    }
+    encoded = json.dumps(answers, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _conversions_digest(conversions: ConversionMatcher | None) -> str | None:
+    if conversions is None:
+        return None
+    encoded = json.dumps(sorted(conversions.conversions.items())).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _settings_fingerprint(app_config: AppSettings, conversions: ConversionMatcher | None) -> list[Any]:
+    # Settings (and conversion table) that change the report text or the auto-fixed copies
+    return [
+        MANIFEST_VERSION,
+        app_config.report_format,
+        app_config.auto_correct_static_markings,
+        app_config.auto_replace_stationary_objects,
+        app_config.make_non_player_ai_only,
+        app_config.overwrite_auto_fixes,
+        _conversions_digest(conversions),
+    ]
+
+
+def _mission_data_to_json(mission_data: MissionData) -> dict[str, Any]:
+    date = mission_data.date
+    return {
+        "path": str(mission_data.path),
+        "map_name": mission_data.map_name,
+        "date": [date.year, date.month, date.day] if date is not None else None,
+        "date_is_custom": mission_data.date_is_custom,
+        "player_squadron": mission_data.player_squadron,
+        "aircraft": [
+            [aircraft.aircraft_code, aircraft.weapon_code, sorted(aircraft.skins)]
+            for aircraft in mission_data.aircraft
+        ],
+        "chiefs": sorted(mission_data.chiefs),
+        "stationaries": sorted(mission_data.stationaries),
+        "buildings": list(mission_data.buildings),
+        "wing_sections": list(mission_data.wing_sections),
+        "stat_planes_without_markings": list(mission_data.stat_planes_without_markings),
+    }
+
+
+def _mission_data_from_json(entry: dict[str, Any]) -> MissionData:
+    date = entry["date"]
+    return MissionData(
+        path=Path(entry["path"]),
+        map_name=entry["map_name"],
+        date=MissionDate(*date) if date is not None else None,
+        date_is_custom=entry["date_is_custom"],
+        player_squadron=entry["player_squadron"],
+        aircraft=tuple(
+            MissionAircraft(aircraft_code=code, weapon_code=weapon, skins=frozenset(skins))
+            for code, weapon, skins in entry["aircraft"]
+        ),
+        chiefs=frozenset(entry["chiefs"]),
+        stationaries=frozenset(entry["stationaries"]),
+        buildings=tuple(entry["buildings"]),
+        wing_sections=tuple(entry["wing_sections"]),
+        stat_planes_without_markings=tuple(entry["stat_planes_without_markings"]),
+    )
+
+
+def _report_to_json(report: MissionReport) -> dict[str, Any]:
+    return {
+        "mission_name": report.mission_name,
+        "mission_data": _mission_data_to_json(report.mission_data),
+        "missing_map": report.missing_map,
+        "missing_objects": sorted(report.missing_objects),
+        "missing_aircrafts": sorted(report.missing_aircrafts),
+        "findings": [
+            [finding.category, finding.identifier, finding.severity, finding.detail]
+            for finding in report.findings
+        ],
+        "full_report": report.full_report,
+    }
+
+
+def _report_from_json(entry: dict[str, Any]) -> MissionReport:
+    return MissionReport(
+        mission_name=entry["mission_name"],
+        mission_data=_mission_data_from_json(entry["mission_data"]),
+        missing_map=entry["missing_map"],
+        missing_objects=frozenset(entry["missing_objects"]),
+        missing_aircrafts=frozenset(entry["missing_aircrafts"]),
+        findings=tuple(
+            Finding(entry["mission_name"], Category(category), identifier, Severity(severity), detail)
+            for category, identifier, severity, detail in entry["findings"]
+        ),
+        full_report=entry["full_report"],
+    )
+
+
+class CampaignManifest:
+    """Cached findings of the missions of a campaign, stored in the output folder.
+
+    An entry is reused when the mission file has the same contents (checked by
+    size and mtime first, then by content hash) and the catalog answers for
+    the assets it references are unchanged.
+    """
+
+    def __init__(
+        self,
+        manifest_path: Path,
+        app_config: AppSettings,
+        entries: dict[str, dict[str, Any]],
+        settings: list[Any],
+    ) -> None:
+        self.manifest_path = manifest_path
+        self.app_config = app_config
+        self.settings = settings
+        self._previous = entries
+        self._entries: dict[str, dict[str, Any]] = {}
+        self.reused = 0
+        self.refreshed = 0
+
+    @classmethod
+    def load(cls, app_config: AppSettings, conversions: ConversionMatcher | None = None) -> "CampaignManifest":
+        """Read the manifest of the previous run, ignoring it if unusable.
+
+        ``conversions`` is the conversion table of the run, when the objects
+        are replaced: editing it invalidates every entry.
+        """
+
+        manifest_path = app_config.output_directory / MANIFEST_FILE_NAME
+        settings = _settings_fingerprint(app_config, conversions)
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            with manifest_path.open(encoding="utf-8") as handle:
+                stored = json.load(handle)
+            if stored.get("settings") == settings:
+                entries = stored["missions"]
+            else:
+                logger.info("Settings changed since the last run; re-validating every mission")
+        except FileNotFoundError:
+            logger.info("No campaign manifest at %s; validating every mission", manifest_path)
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable campaign manifest %s: %s", manifest_path, error)
+
+        return cls(manifest_path, app_config, entries, settings)
+
+    def cached_report(self, mission_path: Path, catalog: AssetCatalog) -> MissionReport | None:
+        """Return the cached report of an unchanged mission, or None."""
+
+        key = str(mission_path)
+        entry = self._previous.get(key)
+        if entry is None or not mission_path.exists():
+            return None
+
+        app_config = self.app_config
+        # Only the missions changed by a fix have a copy; entries of older versions do not tell
+        fixed_copy = entry.get("fixed_copy", auto_fixes_enabled(app_config))
+        if fixed_copy and not (app_config.output_directory / mission_path.name).exists():
+            return None
+
+        try:
+            stat = mission_path.stat()
+            if [stat.st_size, stat.st_mtime_ns] != entry["stat"]:
+                digest = content_hash(mission_path)
+                if digest != entry["hash"]:
+                    logger.debug("Mission %s changed since the last run", mission_path.name)
+                    return None
+                entry = {**entry, "stat": [stat.st_size, stat.st_mtime_ns]}
+
+            report = _report_from_json(entry["report"])
+            if resource_fingerprint(report.mission_data, catalog) != entry["resources"]:
+                logger.debug("Resources used by %s changed since the last run", mission_path.name)
+                return None
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring cached findings of %s: %s", mission_path.name, error)
+            return None
+
+        self._entries[key] = entry
+        self.reused += 1
+        return report
+
+    def record(self, mission_path: Path, report: MissionReport, catalog: AssetCatalog) -> None:
+        """Store the findings of a freshly analyzed mission.
+
+        The size, mtime and hash are those of the contents the findings come
+        from (``report.source``), not of the file as it is now.
+        """
+
+        assert report.source is not None
+        size, mtime_ns, digest = report.source
+        self._entries[str(mission_path)] = {
+            "stat": [size, mtime_ns],
+            "hash": digest,
+            "fixed_copy": report.fixed_copy,
+            "resources": resource_fingerprint(report.mission_data, catalog),
+            "report": _report_to_json(report),
+        }
+        self.refreshed += 1
+
+    def save(self) -> None:
+        """Write the manifest for the missions of this run."""
+
+        temporary_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        try:
+            with temporary_path.open("w", encoding="utf-8") as handle:
+                json.dump(
+                    {"settings": self.settings, "missions": self._entries},
+                    handle,
+                )
+            os.replace(temporary_path, self.manifest_path)
+        except OSError as error:
+            logger.warning("Could not write campaign manifest %s: %s", self.manifest_path, error)
+
+        logger.info(
+            "Incremental run | reused=%d re-validated=%d",
+            self.reused,
+            self.refreshed,
+        )
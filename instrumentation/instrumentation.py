@@ -0,0 +1,124 @@
+"""Lightweight stage timers and counters used by the ``--profile`` switch.
+
+Instrumentation is disabled by default: the timers then cost one flag check
+per call and the counters nothing more. Stages may be nested (for example
+``read_mission`` includes the auto-fix rewrite fed from the same pass), so the
+stage totals are not meant to add up.
+"""
+
+import functools
+import threading
+import time
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_enabled = False
+_stage_seconds: defaultdict[str, float] = defaultdict(float)
+_stage_calls: Counter[str] = Counter()
+_counters: Counter[str] = Counter()
+# The resource loaders record from several threads at once
+_lock = threading.Lock()
+
+
+def enable(enabled: bool = True) -> None:
+    """Turn the timers and counters on or off."""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Return True while instrumentation is collecting data."""
+    return _enabled
+
+
+def reset() -> None:
+    """Forget everything collected so far."""
+    _stage_seconds.clear()
+    _stage_calls.clear()
+    _counters.clear()
+
+
+def _record(name: str, seconds: float) -> None:
+    with _lock:
+        _stage_seconds[name] += seconds
+        _stage_calls[name] += 1
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as one call of stage ``name``."""
+
+    if not _enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - started)
+
+
+def timed(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator timing every call of the function as stage ``name``."""
+
+    def _decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def _wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter() - started)
+
+        return _wrapper
+
+    return _decorator
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add ``amount`` to counter ``name``."""
+    if _enabled:
+        with _lock:
+            _counters[name] += amount
+
+
+def snapshot() -> dict[str, Any]:
+    """Return the collected data in a picklable form (used by worker processes)."""
+    return {
+        "seconds": dict(_stage_seconds),
+        "calls": dict(_stage_calls),
+        "counters": dict(_counters),
+    }
+
+
+def merge(collected: dict[str, Any]) -> None:
+    """Add the data collected by another process."""
+    for name, seconds in collected["seconds"].items():
+        _stage_seconds[name] += seconds
+    _stage_calls.update(collected["calls"])
+    _counters.update(collected["counters"])
+
+
+def format_report() -> str:
+    """Return the stage breakdown and the counters as a text table."""
+
+    name_width = max([len(name) for name in (*_stage_seconds, *_counters)] + [len("Counter")])
+    lines = [f"{'Stage':<{name_width}}  {'Calls':>8}  {'Total (s)':>10}  {'Mean (ms)':>10}"]
+    for name, seconds in sorted(_stage_seconds.items(), key=lambda item: item[1], reverse=True):
+        calls = _stage_calls[name]
+        lines.append(f"{name:<{name_width}}  {calls:>8}  {seconds:>10.3f}  {seconds * 1000 / calls:>10.3f}")
+
+    if _counters:
+        lines.append("")
+        lines.append(f"{'Counter':<{name_width}}  {'Value':>8}")
+        for name, value in sorted(_counters.items()):
+            lines.append(f"{name:<{name_width}}  {value:>8}")
+    return "\n".join(lines)
@@ -0,0 +1,103 @@
+"""Import timer behind the ``--timing-startup`` switch.
+
+Like ``python -X importtime``, each module imported after :meth:`ImportTimer.install`
+is timed on its own (``self``) and with the modules it imports in turn
+(``cumulative``). The timer wraps the loaders found by the other finders of
+``sys.meta_path``, so the modules themselves are loaded as usual.
+"""
+
+import sys
+import time
+
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Sequence
+
+# Modules listed in the report, the slowest first
+REPORT_LIMIT = 15
+
+
+class _TimedLoader(Loader):
+    """Loader running the ``exec_module`` of another loader under the timer."""
+
+    def __init__(self, loader: Loader, timer: "ImportTimer") -> None:
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> Any:
+        # get_source, get_filename, is_package... come from the wrapped loader
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._timer.enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(module.__name__, time.perf_counter() - started)
+
+
+class ImportTimer(MetaPathFinder):
+    """Record the time spent importing each module while installed."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        # (module, self seconds, cumulative seconds), in completion order
+        self.records: list[tuple[str, float, float]] = []
+        # Seconds spent in the nested imports of each module being executed
+        self._nested: list[float] = []
+
+    @classmethod
+    def install(cls) -> "ImportTimer":
+        """Put a new timer in front of the other finders and return it."""
+        timer = cls()
+        sys.meta_path.insert(0, timer)
+        return timer
+
+    def uninstall(self) -> None:
+        """Stop timing the imports; the records are kept."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def enter(self) -> None:
+        self._nested.append(0.0)
+
+    def leave(self, name: str, seconds: float) -> None:
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += seconds
+        self.records.append((name, seconds - nested, seconds))
+
+    def format_report(self, limit: int = REPORT_LIMIT) -> str:
+        """Return the totals and the modules slowest to import, in milliseconds."""
+
+        elapsed = time.perf_counter() - self.started
+        imported = sum(seconds for _, seconds, _ in self.records)
+        lines = [
+            f"Startup: {elapsed * 1000:.1f} ms since the timer started, "
+            f"{imported * 1000:.1f} ms importing {len(self.records)} modules",
+            f"{'self [ms]':>10} | {'cumulative':>10} | module",
+        ]
+        slowest = sorted(self.records, key=lambda record: record[2], reverse=True)[:limit]
+        for name, self_seconds, cumulative in slowest:
+            lines.append(f"{self_seconds * 1000:>10.1f} | {cumulative * 1000:>10.1f} | {name}")
+        return "\n".join(lines)
@@ -2,41 +2,319 @@
 
 import logging
 
-from contextlib import redirect_stdout
-from pathlib import Path
+import os
 import sys
 
-from aircraft.aircraft import read_aircrafts
-from chiefs.chiefs import read_chiefs
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import ExitStack, closing, contextmanager
+from dataclasses import dataclass, field, replace
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from analyzer.analyzer import MissionReport, analyze_mission
+from catalog.catalog import AssetCatalog, load_catalog
 from config.app_settings import read_app_settings, AppSettings
-from conversions.static_conversions import read_conversion_file
-from maps.maps import read_maps
-from missions.missions import read_mission, read_missions
-from objects.objects import read_objects
-from report.report import (
-    generate_missing_objects_ini,
-    log_buildings,
-    log_chiefs,
-    log_missing_squadrons,
-    log_planes_details,
-    log_planes_without_markings,
-    log_stationaries,
-    log_used_aircrafts,
-    log_squadrons
-)
-from skins.skins import read_skins
-from squadrons.squadrons import read_squadrons
-from stationary.stationary import read_stationaries
-from weapons.weapons import read_weapons
+from conversions.static_conversions import ConversionMatcher, load_conversion_matcher
+from instrumentation import instrumentation
+from missions.missions import CAMPAIGN_FILE_NAME, read_missions
+from missions.prefetch import MissionPrefetcher
+from resources.resource_loader import configure_resource_cache
+from report.aggregation import FIX_PRIORITY_FILE_NAME, INDEX_FILE_NAME, CampaignIndex, format_fix_priority
+from report.findings import Category
+from report.report import generate_missing_objects_ini
+from report.writers import open_report_writers
+
+# Only imported by the runs enabling them, to keep the startup short
+if TYPE_CHECKING:
+    from incremental.incremental import CampaignManifest
+    from suggestions.suggestions import CatalogSuggestions
 
 logger = logging.getLogger(__name__)
 
+REPORT_FILE_NAME = "CampaignAnalyzerOutput.txt"
+BATCH_SUMMARY_FILE_NAME = "CampaignBatchSummary.txt"
+
+# Per-process state of the worker processes used by the parallel run
+_worker_catalog: AssetCatalog | None = None
+_worker_conversions: ConversionMatcher | None = None
+
+
+def _init_worker(
+    catalog: AssetCatalog,
+    conversions: ConversionMatcher | None,
+    profile: bool,
+) -> None:
+    global _worker_catalog, _worker_conversions  # pylint: disable=global-statement
+    _worker_catalog = catalog
+    _worker_conversions = conversions
+    instrumentation.enable(profile)
+
+
+def _analyze_in_worker(
+    mission_path: Path,
+    app_config: AppSettings,
+) -> tuple[MissionReport, dict | None]:
+    assert _worker_catalog is not None
+    # Ship only this mission's timings back, the parent merges them
+    instrumentation.reset()
+    mission_report = analyze_mission(mission_path, _worker_catalog, app_config, _worker_conversions)
+    return mission_report, instrumentation.snapshot() if instrumentation.is_enabled() else None
+
+
+def _resolve_jobs(jobs: int, mission_count: int) -> int:
+    """Number of worker processes to use; ``0`` or less means one per CPU."""
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, mission_count))
+
+
+def _open_worker_pool(
+    stack: ExitStack,
+    catalog: AssetCatalog,
+    app_config: AppSettings,
+    conversions: ConversionMatcher | None,
+    mission_count: int,
+) -> Executor | None:
+    """Start the worker processes, or return None when the run is serial."""
+
+    jobs = _resolve_jobs(app_config.jobs, mission_count)
+    if jobs == 1:
+        return None
+
+    # multiprocessing is only imported by parallel runs
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    logger.info("Analyzing missions with %d worker processes", jobs)
+    return stack.enter_context(
+        ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(catalog, conversions, app_config.profile),
+        )
+    )
 
-def main(cli_arguments: AppSettings | None = None) -> None:
-    """Validate missions for missing assets."""
 
-    logger.info("Campaign analyzer started")
+def _iter_mission_reports(
+    mission_list: list[Path],
+    catalog: AssetCatalog,
+    app_config: AppSettings,
+    conversions: ConversionMatcher | None,
+    executor: Executor | None,
+) -> Iterator[MissionReport]:
+    """Yield the mission reports in campaign order, serially or from the worker pool."""
+
+    if executor is None:
+        # The next missions are read from disk while the current one is analyzed
+        with MissionPrefetcher(
+            mission_list, app_config.prefetch_depth, app_config.prefetch_memory_mb
+        ) as prefetcher:
+            for mission_path, mission_file in prefetcher:
+                yield analyze_mission(mission_path, catalog, app_config, conversions, mission_file)
+        return
+
+    # map() yields in submission order, so the report matches the serial run
+    for mission_report, profile_data in executor.map(
+        _analyze_in_worker, mission_list, repeat(app_config)
+    ):
+        if profile_data is not None:
+            instrumentation.merge(profile_data)
+        yield mission_report
+
+
+def _iter_campaign_reports(
+    mission_list: list[Path],
+    catalog: AssetCatalog,
+    app_config: AppSettings,
+    conversions: ConversionMatcher | None,
+    manifest: "CampaignManifest | None",
+    executor: Executor | None,
+) -> Iterator[MissionReport]:
+    """Yield the mission reports in campaign order, reusing cached findings when possible.
+
+    With a manifest, only the missions whose contents or referenced resources
+    changed are analyzed; the cached reports of the others are spliced in.
+    """
+
+    if manifest is None:
+        yield from _iter_mission_reports(mission_list, catalog, app_config, conversions, executor)
+        return
+
+    cached_reports = [manifest.cached_report(mission_path, catalog) for mission_path in mission_list]
+    stale_missions = [
+        mission_path
+        for mission_path, cached in zip(mission_list, cached_reports)
+        if cached is None
+    ]
+    logger.info(
+        "Incremental run: %d of %d missions need to be analyzed",
+        len(stale_missions),
+        len(mission_list),
+    )
+
+    with closing(
+        _iter_mission_reports(stale_missions, catalog, app_config, conversions, executor)
+    ) as fresh_reports:
+        for mission_path, cached in zip(mission_list, cached_reports):
+            if cached is not None:
+                yield cached
+                continue
+            mission_report = next(fresh_reports, None)
+            if mission_report is None or mission_report.mission_name != mission_path.name:
+                raise RuntimeError(
+                    f"Incremental run: no fresh report for mission {mission_path.name} "
+                    f"({len(stale_missions)} missions were re-analyzed)"
+                )
+            manifest.record(mission_path, mission_report, catalog)
+            yield mission_report
+
+    manifest.save()
+
+
+@dataclass
+class CampaignResult:
+    """Assets used and missing in one campaign."""
 
+    campaign_path: Path
+    index: CampaignIndex = field(default_factory=CampaignIndex)
+
+    @property
+    def mission_count(self) -> int:
+        return len(self.index.missions)
+
+    @property
+    def missing_maps(self) -> set[str]:
+        return self.index.missing(Category.MISSING_MAP)
+
+    @property
+    def missing_objects(self) -> set[str]:
+        return self.index.missing(Category.MISSING_OBJECT)
+
+    @property
+    def missing_aircrafts(self) -> set[str]:
+        return self.index.missing(Category.MISSING_AIRCRAFT)
+
+    @property
+    def missing_chiefs(self) -> set[str]:
+        return self.index.missing(Category.MISSING_CHIEF)
+
+    @property
+    def missing_stationaries(self) -> set[str]:
+        return self.index.missing(Category.MISSING_STATIONARY)
+
+
+def _load_shared_resources(app_config: AppSettings) -> tuple[AssetCatalog, ConversionMatcher | None]:
+    """Load the resource catalog and the conversion table used by every campaign."""
+
+    resource_cache = configure_resource_cache(
+        app_config.cache_directory if app_config.use_resource_cache else None
+    )
+    catalog = load_catalog(app_config)
+    if resource_cache is not None:
+        resource_cache.log_stats()
+
+    conversions: ConversionMatcher | None = None
+    if app_config.auto_replace_stationary_objects:
+        conversions = load_conversion_matcher(Path(__file__).resolve().parent)
+    return catalog, conversions
+
+
+def _open_suggestions(catalog: AssetCatalog, app_config: AppSettings) -> "CatalogSuggestions | None":
+    """Return the suggestion indexes of the catalog when a draft conversions file is wanted."""
+
+    if not app_config.suggest_conversions:
+        return None
+    from suggestions.suggestions import CatalogSuggestions  # pylint: disable=import-outside-toplevel
+
+    return CatalogSuggestions(catalog)
+
+
+def _analyze_campaign(
+    app_config: AppSettings,
+    mission_list: list[Path],
+    catalog: AssetCatalog,
+    conversions: ConversionMatcher | None,
+    executor: Executor | None,
+    suggestions: "CatalogSuggestions | None" = None,
+) -> CampaignResult:
+    """Analyze the missions of one campaign and write its report.
+
+    ``suggestions`` is given when a draft conversions file is wanted.
+    """
+
+    result = CampaignResult(Path(app_config.campaign_path))
+    manifest: "CampaignManifest | None" = None
+    if app_config.incremental:
+        from incremental.incremental import CampaignManifest  # pylint: disable=import-outside-toplevel
+
+        manifest = CampaignManifest.load(app_config, conversions)
+
+    with ExitStack() as stack:
+        writers = open_report_writers(stack, app_config)
+        for mission_report in _iter_campaign_reports(
+            mission_list, catalog, app_config, conversions, manifest, executor
+        ):
+            with instrumentation.stage("write report"):
+                for writer in writers:
+                    writer.write_mission(mission_report)
+            with instrumentation.stage("aggregate"):
+                result.index.add(mission_report)
+
+    result.index.save(app_config.output_directory / INDEX_FILE_NAME)
+    fix_priority_path = app_config.output_directory / FIX_PRIORITY_FILE_NAME
+    fix_priority_path.write_text(format_fix_priority(result.index), encoding="utf-8")
+    logger.info("Fix priority report written to %s", fix_priority_path)
+
+    if suggestions is not None:
+        from suggestions.suggestions import (  # pylint: disable=import-outside-toplevel
+            DRAFT_CONVERSIONS_FILE_NAME,
+            format_draft_conversions,
+        )
+
+        draft_path = app_config.output_directory / DRAFT_CONVERSIONS_FILE_NAME
+        with instrumentation.stage("suggest conversions"):
+            draft = format_draft_conversions(result.index, suggestions)
+        draft_path.write_text(draft, encoding="utf-8")
+        logger.info("Draft conversions written to %s", draft_path)
+
+    missing_objects = result.missing_objects
+    if missing_objects:
+        logging.info("Generating 'ini' file with missing buildings")
+        generate_missing_objects_ini(
+            missing_objects, app_config.output_directory
+        )
+    return result
+
+
+@contextmanager
+def _profiled(app_config: AppSettings) -> Iterator[None]:
+    """Collect the stage timers (and a cProfile dump) of the enclosed run when enabled."""
+
+    instrumentation.reset()
+    instrumentation.enable(app_config.profile)
+    profiler = None
+    if app_config.profile_dump:
+        import cProfile  # pylint: disable=import-outside-toplevel
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            # Covers the main process only; worker processes are not profiled
+            profiler.disable()
+            profiler.dump_stats(app_config.profile_dump_path)
+            logger.info("cProfile statistics written to %s", app_config.profile_dump_path)
+        if app_config.profile:
+            print("### Profile")
+            print(instrumentation.format_report())
+        instrumentation.enable(False)
+
+
+def _resolve_settings(cli_arguments: AppSettings | None) -> AppSettings:
     if cli_arguments is not None:
         logger.debug("Using CLI-provided application settings")
         app_config = cli_arguments
@@ -46,27 +324,23 @@ def main(cli_arguments: AppSettings | None = None) -> None:
 
     app_config.output_directory.mkdir(parents=True, exist_ok=True)
     logger.debug("Output directory prepared at %s", app_config.output_directory)
+    return app_config
 
-    logger.info("Loading standard installation resources")
-    aircrafts = read_aircrafts(app_config.std_path)
-    chiefs = read_chiefs(app_config.std_path)
-    skins = read_skins(app_config.skin_path)
-    stationaries = read_stationaries(app_config.std_path)
-    objects = read_objects(app_config.std_path)
-    weapons = read_weapons(app_config.std_path)
-    squadrons = read_squadrons(app_config.std_path)
-    maps = read_maps(app_config.maps_path_folder)
 
-    logger.info(
-        "Resource counts | aircraft=%d chiefs=%d stationaries=%d objects=%d weapons=%d squadrons=%d maps=%d",
-        len(aircrafts),
-        len(chiefs),
-        len(stationaries),
-        len(objects),
-        len(weapons),
-        len(squadrons),
-        len(maps)
-    )
+def main(cli_arguments: AppSettings | None = None) -> None:
+    """Validate missions for missing assets."""
+
+    logger.info("Campaign analyzer started")
+
+    app_config = _resolve_settings(cli_arguments)
+    with _profiled(app_config):
+        _validate_campaign(app_config)
+
+
+def _validate_campaign(app_config: AppSettings) -> None:
+    """Load the resources, analyze every mission and write the reports."""
+
+    catalog, conversions = _load_shared_resources(app_config)
 
     campaign_path = Path(app_config.campaign_path)
     # Check directory
@@ -77,174 +351,179 @@ def main(cli_arguments: AppSettings | None = None) -> None:
     mission_list: list[Path] = read_missions(campaign_path)
     logger.info("Discovered %d missions to analyze", len(mission_list))
 
+    with ExitStack() as stack:
+        executor = _open_worker_pool(stack, catalog, app_config, conversions, len(mission_list))
+        suggestions = _open_suggestions(catalog, app_config)
+        result = _analyze_campaign(app_config, mission_list, catalog, conversions, executor, suggestions)
 
-    mission_missing_objects: set[str] = set()
-    campaign_missing_objects: set[str] = set()
-    campaign_missing_aircrafts: set[str] = set()
-    missing_maps: set[str] = set()
-
-    with app_config.output_path.open("w", encoding="utf-8") as output_stream:
-        with redirect_stdout(output_stream):
-            for mission_path in mission_list:
-                missing_aircrafts: set[str] = set()
-
-                mission_name = mission_path.name
-                logger.info("Analyzing mission %s", mission_name)
-                mission_data = read_mission(mission_path)
-
-                print(f"Reading mission {mission_name}")
-                if mission_data.map_name:
-                    print(f"Mission Map = {mission_data.map_name}")
-                    if mission_data.map_name not in maps:
-                        print(f"Missing Map = {mission_data.map_name}")
-                        missing_maps.add(mission_data.map_name)
-
-                if mission_data.date and mission_data.date_is_custom:
-                    mission_date = mission_data.date
-                    print(
-                        f"Mission Date: {mission_date.year}-{mission_date.month}-{mission_date.day}"
-                    )
-                else:
-                    print("###Mission Date not set")
-
-                log_used_aircrafts(mission_data.aircraft, app_config.report_format)
-                log_squadrons(mission_data.wing_sections, app_config.report_format)
-                log_chiefs(mission_data.chiefs, app_config.report_format)
-                log_stationaries(mission_data.stationaries, app_config.report_format)
-                missing_aircrafts = log_planes_details(mission_data.aircraft, aircrafts, skins, weapons)
-                log_planes_without_markings(mission_data.stat_planes_without_markings)
-                log_missing_squadrons(mission_data.wing_sections, squadrons)
-                missing_objects = log_buildings(mission_data.buildings, objects)
-
-                if missing_objects:
-                    mission_missing_objects |= missing_objects
-
-                # Auto-Fixes
-                player_squadron = mission_data.player_squadron
-                wing_list = list(mission_data.wing_sections)
-                if app_config.auto_correct_static_markings or \
-                    app_config.auto_replace_stationary_objects or \
-                    app_config.make_non_player_ai_only:
-                    output_mission_path = app_config.output_directory / mission_name
-                    if not output_mission_path.exists():
-                        logger.debug("Applying auto-fixes for mission %s", mission_name)
-                        with mission_path.open(encoding="utf-8") as mission_file, output_mission_path.open(
-                            "x", encoding="utf-8"
-                        ) as mission_copy:
-                            current_squadron = ""
-                            for line in mission_file:
-                                if app_config.make_non_player_ai_only:
-                                    if line.lower().rstrip() == "[wing]":
-                                        mission_copy.write(line)
-                                        line = mission_file.readline()
-                                        while line and not line.strip().startswith("["):
-                                            identifier = line.strip()
-                                            if identifier and identifier not in wing_list:
-                                                wing_list.append(identifier)
-                                                logger.debug(
-                                                    "Mission %s auto-fix registered wing %s",
-                                                    mission_name,
-                                                    identifier,
-                                                )
-                                            mission_copy.write(line)
-                                            line = mission_file.readline()
-                                        if not line:
-                                            break
-                                    if line.strip().startswith("[") and line.strip()[1:-1] in wing_list:
-                                        current_squadron = line.strip()[1:-1]
-                                        if current_squadron != player_squadron:
-                                            mission_copy.write(line)
-                                            line = mission_file.readline()
-                                            if not line:
-                                                break
-                                            mission_copy.write(line)
-                                            line = mission_file.readline()
-                                            if not line:
-                                                break
-                                            if "OnlyAI" not in line:
-                                                mission_copy.write("  OnlyAI 1\n")
-                                                logger.debug(
-                                                    "Mission %s auto-fix set OnlyAI=1 for %s",
-                                                    mission_name,
-                                                    current_squadron,
-                                                )
-                                            else:
-                                                mission_copy.write(line)
-                                                line = mission_file.readline()
-                                            if not line:
-                                                break
-
-                                if app_config.auto_replace_stationary_objects:
-                                    dir_path = Path(__file__).resolve().parent
-                                    logger.debug("Loading conversion database from %s", dir_path)
-                                    conversion_db = read_conversion_file(dir_path)
-
-                                    for item, replacement in conversion_db.items():
-                                        if f"{item} " in line:
-                                            line = line.replace(item, replacement)
-                                            logger.debug(
-                                                "Mission %s auto-fix replaced %s with %s",
-                                                mission_name,
-                                                item,
-                                                replacement,
-                                            )
-
-                                if app_config.auto_correct_static_markings and "vehicles.planes" in line:
-                                    line_data = line.split()
-                                    if len(line_data) >= 2:
-                                        if line_data[-1] == "0" and line_data[-2].lower() == "null":
-                                            new_line = line.rstrip()[:-1] + "1"
-                                            line = new_line + "\n"
-                                            logger.debug(
-                                                "Mission %s auto-fix corrected markings for %s",
-                                                mission_name,
-                                                line_data[1],
-                                            )
-                                        elif line_data[-1].lower() == "null":
-                                            line = line.rstrip() + " 1\n"
-                                            logger.debug(
-                                                "Mission %s auto-fix appended markings for %s",
-                                                mission_name,
-                                                line_data[1],
-                                            )
-
-                                mission_copy.write(line)
-                    else:
-                        logger.debug(
-                            "Skipped auto-fixes for %s, output already exists at %s",
-                            mission_name,
-                            output_mission_path,
-                        )
-                else:
-                    logger.debug("Auto-fixes disabled for mission %s", mission_name)
-
-                print()
-                logger.info("Finished mission %s", mission_name)
-
-                campaign_missing_objects |= mission_missing_objects
-                campaign_missing_aircrafts |= missing_aircrafts
-
-    if campaign_missing_objects:
-        logging.info("Generating 'ini' file with missing buildings")
-        generate_missing_objects_ini(
-            campaign_missing_objects, app_config.output_directory
-        )
-
+    missing_maps = result.missing_maps
     if missing_maps:
         print("### Missing maps:")
-        for missing_map in missing_maps:
+        for missing_map in sorted(missing_maps):
             print(f"- {missing_map}")
     else:
         print("### Missing maps: None")
 
-    if campaign_missing_aircrafts and campaign_missing_aircrafts != {None}:
-        print("Missing aircrafts:")
-        for missing_aircraft in campaign_missing_aircrafts:
+    missing_aircrafts = result.missing_aircrafts
+    if missing_aircrafts:
+        print("### Missing aircrafts:")
+        for missing_aircraft in sorted(missing_aircrafts):
             print(f"- {missing_aircraft}")
     else:
         print("### Missing aircrafts: None")
 
+    for title, missing_names in (
+        ("chiefs", result.missing_chiefs),
+        ("stationaries", result.missing_stationaries),
+    ):
+        if missing_names:
+            print(f"### Missing {title}:")
+            for missing_name in sorted(missing_names):
+                print(f"- {missing_name}")
+        else:
+            print(f"### Missing {title}: None")
+
+
+def find_campaigns(campaigns_root: Path) -> list[Path]:
+    """Return every folder below ``campaigns_root`` holding a campaign.ini, sorted."""
+
+    campaigns: list[Path] = []
+    for folder, _, file_names in os.walk(campaigns_root):
+        # IL-2 runs on Windows, where the file name case is not significant
+        if any(name.lower() == CAMPAIGN_FILE_NAME for name in file_names):
+            campaigns.append(Path(folder))
+    campaigns.sort()
+    logger.info("Discovered %d campaigns under %s", len(campaigns), campaigns_root)
+    return campaigns
+
+
+def main_batch(campaigns_root: Path, cli_arguments: AppSettings | None = None) -> None:
+    """Validate every campaign found below ``campaigns_root`` with one resource catalog.
+
+    Each campaign gets its report (and auto-fixed missions) in its own folder of
+    the output directory, mirroring the campaign tree; the missing assets of
+    the whole tree are summarized in CampaignBatchSummary.txt.
+    """
+
+    logger.info("Campaign analyzer started in batch mode")
+
+    app_config = _resolve_settings(cli_arguments)
+    campaigns_root = Path(campaigns_root)
+    if not campaigns_root.is_dir():
+        logger.error("Can not find the campaigns folder: %s", campaigns_root)
+        sys.exit(1)
+
+    with _profiled(app_config):
+        _validate_campaign_tree(app_config, campaigns_root)
+
+
+def _validate_campaign_tree(app_config: AppSettings, campaigns_root: Path) -> None:
+    """Analyze every campaign below ``campaigns_root`` and write the summary."""
+
+    catalog, conversions = _load_shared_resources(app_config)
+
+    campaigns: list[tuple[AppSettings, list[Path]]] = []
+    skipped: list[tuple[Path, str]] = []
+    for campaign_path in find_campaigns(campaigns_root):
+        try:
+            mission_list = read_missions(campaign_path)
+        except SystemExit:
+            # One broken campaign should not stop the validation of the whole tree
+            skipped.append((campaign_path, "campaign.ini could not be read"))
+            continue
+        missing_missions = [path.name for path in mission_list if not path.exists()]
+        if missing_missions:
+            # One broken campaign should not stop the validation of the whole tree
+            reason = f"missions not found: {', '.join(missing_missions)}"
+            logger.error("Skipping campaign %s, %s", campaign_path, reason)
+            skipped.append((campaign_path, reason))
+            continue
+
+        output_directory = app_config.output_directory / campaign_path.relative_to(campaigns_root)
+        output_directory.mkdir(parents=True, exist_ok=True)
+        campaign_config = replace(
+            app_config,
+            campaign_path=campaign_path,
+            output_directory=output_directory,
+            output_path=output_directory / REPORT_FILE_NAME,
+        )
+        campaigns.append((campaign_config, mission_list))
+
+    results: list[CampaignResult] = []
+    # Shared by the campaigns, so the catalog is indexed once
+    suggestions = _open_suggestions(catalog, app_config)
+    mission_count = sum(len(mission_list) for _, mission_list in campaigns)
+    with ExitStack() as stack:
+        # One pool for the whole tree: the catalog is sent to each worker once
+        executor = _open_worker_pool(stack, catalog, app_config, conversions, mission_count)
+        for campaign_config, mission_list in campaigns:
+            logger.info("Analyzing campaign %s", campaign_config.campaign_path)
+            results.append(
+                _analyze_campaign(campaign_config, mission_list, catalog, conversions, executor, suggestions)
+            )
+
+    campaign_missing_objects: set[str] = set()
+    for result in results:
+        campaign_missing_objects |= result.missing_objects
+    if campaign_missing_objects:
+        logging.info("Generating 'ini' file with the missing buildings of every campaign")
+        generate_missing_objects_ini(campaign_missing_objects, app_config.output_directory)
+
+    summary = format_batch_summary(results, skipped, campaigns_root)
+    summary_path = app_config.output_directory / BATCH_SUMMARY_FILE_NAME
+    summary_path.write_text(summary, encoding="utf-8")
+    logger.info("Batch summary written to %s", summary_path)
+    print(summary, end="")
+
+
+def format_batch_summary(
+    results: list[CampaignResult],
+    skipped: list[tuple[Path, str]],
+    campaigns_root: Path,
+) -> str:
+    """Return the missing assets of the tree, each with the campaigns missing it."""
+
+    def _campaign_name(campaign_path: Path) -> str:
+        return campaign_path.relative_to(campaigns_root).as_posix()
+
+    def _section(title: str, attribute: str) -> list[str]:
+        missing_in: defaultdict[str, list[str]] = defaultdict(list)
+        for result in results:
+            for name in getattr(result, attribute):
+                if name:
+                    missing_in[name].append(_campaign_name(result.campaign_path))
+        if not missing_in:
+            return [f"### {title}: None"]
+        lines = [f"### {title}: {len(missing_in)}"]
+        for name in sorted(missing_in):
+            lines.append(f"- {name} ({', '.join(missing_in[name])})")
+        return lines
+
+    lines = [
+        f"Campaigns analyzed: {len(results)}",
+        f"Missions analyzed: {sum(result.mission_count for result in results)}",
+    ]
+    lines += _section("Missing maps", "missing_maps")
+    lines += _section("Missing aircrafts", "missing_aircrafts")
+    lines += _section("Missing objects", "missing_objects")
+    lines += _section("Missing chiefs", "missing_chiefs")
+    lines += _section("Missing stationaries", "missing_stationaries")
+    if skipped:
+        lines.append(f"### Skipped campaigns: {len(skipped)}")
+        for campaign_path, reason in skipped:
+            lines.append(f"- {_campaign_name(campaign_path)}: {reason}")
+    return "\n".join(lines) + "\n"
+
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+
+        # In the frozen executable, the worker processes start here and must not run the analyzer
+        freeze_support()
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
-    main()
+    if len(sys.argv) > 1:
+        # python main.py <campaigns folder> validates every campaign below it
+        main_batch(Path(sys.argv[1]))
+    else:
+        main()
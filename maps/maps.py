@@ -6,6 +6,7 @@ Get the maps from the MODS\MAPMODS\Maps\all.ini
 from pathlib import Path
 from typing import Iterator, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 EXCLUDE_PREFIXES = (";", "[")
@@ -40,6 +41,7 @@ def _parse_maps(handle: TextIO) -> list[str]:
     return maps
 
 
+@timed("read_maps")
 def read_maps(root: Path) -> list[str]:
     """Read maps from all.ini file """
 
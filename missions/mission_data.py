@@ -1,11 +1,16 @@
-"""Dataclasses representing mission-level information."""
+"""Dataclasses representing mission-level information.
+
+The classes are slotted and the identifiers they hold are interned by the
+mission reader, so keeping the data of a whole campaign in memory stores
+each aircraft, skin or object name once.
+"""
 
 from dataclasses import dataclass
 from pathlib import Path
 from typing import FrozenSet, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionDate:
     """Mission date components extracted from a mission file."""
 
@@ -14,7 +19,7 @@ class MissionDate:
     day: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionAircraft:
     """Aircraft assignment for a wing in a mission."""
 
@@ -23,7 +28,7 @@ class MissionAircraft:
     skins: FrozenSet[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionData:
     """Aggregated mission data used by the analyzer."""
 
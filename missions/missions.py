@@ -1,12 +1,19 @@
 """Helpers for reading campaign mission listings."""
 
+import hashlib
 import logging
 import sys
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable
+
+from instrumentation.instrumentation import count, timed
+from resources.text_decoding import open_text, text_stream
 
 from .mission_data import MissionAircraft, MissionData, MissionDate
+from .tokenizer import MissionLine, iter_mission_lines
 
 
 logger = logging.getLogger(__name__)
@@ -19,12 +26,34 @@ def _iter_mission_tokens(lines: Iterable[str]) -> Iterable[str]:
                 yield token.rstrip()
 
 
+CAMPAIGN_FILE_NAME = "campaign.ini"
+
+
+def find_campaign_ini(campaign_path: Path) -> Path | None:
+    """Return the campaign.ini of ``campaign_path``, whatever the case of its name, or None."""
+    campaign_ini = campaign_path / CAMPAIGN_FILE_NAME
+    if campaign_ini.is_file():
+        return campaign_ini
+    # IL-2 runs on Windows, where the file name case is not significant
+    try:
+        for entry in campaign_path.iterdir():
+            if entry.name.lower() == CAMPAIGN_FILE_NAME and entry.is_file():
+                return entry
+    except OSError:
+        pass
+    return None
+
+
+@timed("read_missions")
 def read_missions(campaign_path: Path) -> list[Path]:
-    """Return the list of mission file paths defined in campaign.ini."""
-    campaign_ini = campaign_path / "campaign.ini"
+    """Return the list of mission file paths defined in campaign.ini.
+
+    The file is decoded as UTF-8 or, for legacy campaigns, Windows-1251.
+    """
+    campaign_ini = find_campaign_ini(campaign_path)
     # Check file
-    if not campaign_ini.exists():
-        logger.error("Can not find the path to the campaign.ini file: %s", campaign_ini)
+    if campaign_ini is None:
+        logger.error("Can not find the path to the campaign.ini file: %s", campaign_path / CAMPAIGN_FILE_NAME)
         sys.exit(1)
 
     logger.info("Loading missions from %s", campaign_ini)
@@ -32,7 +61,8 @@ def read_missions(campaign_path: Path) -> list[Path]:
     mission_paths: list[Path] = []
 
     in_list_section = False
-    with campaign_ini.open(encoding="utf-8") as f:
+    handle, _ = open_text(campaign_ini)
+    with handle as f:
         for line in f:
             line = line.strip()
 
@@ -55,243 +85,299 @@ def read_missions(campaign_path: Path) -> list[Path]:
     return mission_paths
 
 
-def read_mission(mission_path: Path) -> MissionData:
-    """Read a mission file and extract relevant data."""
+@dataclass(frozen=True, slots=True)
+class MissionFile:
+    """Contents of a mission file, with the size and mtime it had before it was read.
 
-    logger.info("Reading mission file %s", mission_path)
+    A mission saved again while it is read then looks changed to the next
+    incremental run, instead of being cached with findings of older contents.
+    """
 
-    # All the missions configured in the campaign should exits
-    if not mission_path.exists:
-        logger.exception("Mission file not found: %s. Check the campaing file", mission_path)
-        sys.exit(1)
+    contents: bytes
+    size: int
+    mtime_ns: int
 
-    # Read all lines from the mission file
-    lines: List[str] = mission_path.read_text(encoding="utf-8").splitlines()
+    @classmethod
+    def read(cls, mission_path: Path) -> "MissionFile":
+        stat = mission_path.stat()
+        return cls(mission_path.read_bytes(), stat.st_size, stat.st_mtime_ns)
 
-    aircraft_entries: list[MissionAircraft] = []
-    stat_planes_without_markings: list[str] = []
-    chiefs_list: set[str] = set()
-    stationaries_list: set[str] = set()
-    buildings_list: list[str] = []
-    wing_sections: list[str] = []
+    def fingerprint(self) -> tuple[int, int, str]:
+        """Return the size, mtime and SHA-256 of the contents, as stored by the campaign manifest."""
+        return self.size, self.mtime_ns, hashlib.sha256(self.contents).hexdigest()
 
-    player_sqdn = ""
-    map_name: str | None = None
-    date_year: str | None = None
-    date_month: str | None = None
-    date_day: str | None = None
-    date_is_custom = False
 
-    idx = 0
-    total_lines = len(lines)
+# Sections whose body lines are consumed by the builder until the next "[" line
+_WING_LIST = "wing_list"
+_WING = "wing"
+_CHIEFS = "chiefs"
+_NSTATIONARY = "nstationary"
+_BUILDINGS = "buildings"
 
-    while idx < total_lines:
-        raw_line = lines[idx]
 
-        # Strip whitespace and convert to lowercase
-        lower_line = raw_line.strip().lower()
-        idx += 1
+class MissionDataBuilder:
+    """Incrementally build :class:`MissionData` from a stream of mission lines.
 
-        # Skipping empty lines
-        if not lower_line:
-            continue
-
-        # Player Squadron
-        if "player " in lower_line:
-            tokens = lower_line.split()
-            if len(tokens) > 1:
-                player_sqdn = tokens[1]
-                logger.debug("Player squadron detected: %s", player_sqdn)
-            continue
-
-        # Map name
+    The builder is fed the events of :func:`iter_mission_lines` one by one, so
+    other consumers (the auto-fix rewriter) can share the same single pass over
+    the file. ``player_squadron`` and ``wing_sections`` reflect the lines seen
+    so far. Identifiers are interned, so missions share their copies.
+    """
+
+    def __init__(self, mission_path: Path) -> None:
+        self.mission_path = mission_path
+        # Encoding the mission file was decoded with, for the auto-fixed copy
+        self.encoding = "utf-8"
+        self.player_squadron = ""
+        self.wing_sections: list[str] = []
+
+        self._aircraft_entries: list[MissionAircraft] = []
+        self._stat_planes_without_markings: list[str] = []
+        self._chiefs: set[str] = set()
+        self._stationaries: set[str] = set()
+        self._buildings: list[str] = []
+
+        self._map_name: str | None = None
+        self._awaiting_map = False
+        self._season_lines: list[str] | None = None
+        self._date: tuple[str, str, str] | None = None
+        self._date_is_custom = False
+
+        self._mode: str | None = None
+        self._skin_set: set[str] = set()
+        self._aircraft_code = ""
+
+    def feed(self, event: MissionLine) -> None:
+        """Process the next line of the mission."""
+
+        # Map name: the lines between [MAIN] and its MAP entry are skipped
         # Exmaple: MAP KM_Nordbayern/load.ini
-        if lower_line == "[main]":
-            map_found = False
-            while not map_found:
-                if lines[idx].strip().startswith("MAP "):
-                    map_found = True
-                    map_name = lines[idx].split("MAP ")[1]
-                    logger.debug("Mission map detected: %s", map_name)
-                else:
-                    if idx < total_lines:
-                        idx += 1
-                    else:
-                        logger.warning("[Main] section missing map entry in %s", mission_path)
-                        sys.exit(1)
-
-        if lower_line == "[season]":
-            if idx + 2 < total_lines:
-                year_line = lines[idx].strip()
-                month_line = lines[idx + 1].strip()
-                day_line = lines[idx + 2].strip()
-
-                date_year = year_line[5:] if len(year_line) >= 5 else ""
-                date_month = month_line[6:] if len(month_line) >= 6 else ""
-                date_day = day_line[4:] if len(day_line) >= 4 else ""
-
-                if not (date_year == "1940" and date_month == "7" and date_day == "10"):
-                    date_is_custom = True
-
-                logger.debug("Mission date: %s-%s-%s", date_year, date_month, date_day)
+        if self._awaiting_map:
+            fields = event.raw_line.split(maxsplit=1)
+            if event.key != "MAP" or len(fields) < 2:
+                return
+            self._awaiting_map = False
+            self._map_name = sys.intern(fields[1].rstrip())
+            logger.debug("Mission map detected: %s", self._map_name)
+            return
+
+        # The three lines after [SEASON] are the year, month and day
+        if self._season_lines is not None:
+            self._season_lines.append(event.raw_line.strip())
+            if len(self._season_lines) == 3:
+                self._set_date(*self._season_lines)
+                self._season_lines = None
+            return
+
+        # Skipping empty lines
+        if not event.key:
+            return
+
+        if not event.is_header:
+            if self._mode is not None:
+                self._feed_section_body(event.raw_line.strip())
+            elif event.key.lower() == "player":
+                # Player Squadron
+                tokens = event.raw_line.split()
+                if len(tokens) > 1:
+                    self.player_squadron = sys.intern(tokens[1].lower())
+                    logger.debug("Player squadron detected: %s", self.player_squadron)
+            return
+
+        self._mode = None
+        section_name = event.section.lower()
+        if section_name == "main":
+            self._awaiting_map = True
+        elif section_name == "season":
+            self._season_lines = []
+        elif section_name == "wing":
+            self._mode = _WING_LIST
+        elif section_name in self.wing_sections:
+            self._mode = _WING
+            self._skin_set = set()
+            self._aircraft_code = ""
+        elif section_name == "chiefs":
+            self._mode = _CHIEFS
+        elif section_name == "nstationary":
+            self._mode = _NSTATIONARY
+        elif section_name == "buildings":
+            self._mode = _BUILDINGS
+
+    def _set_date(self, year_line: str, month_line: str, day_line: str) -> None:
+        date_year = year_line[5:] if len(year_line) >= 5 else ""
+        date_month = month_line[6:] if len(month_line) >= 6 else ""
+        date_day = day_line[4:] if len(day_line) >= 4 else ""
+
+        if not (date_year == "1940" and date_month == "7" and date_day == "10"):
+            self._date_is_custom = True
+
+        self._date = (date_year, date_month, date_day)
+        logger.debug("Mission date: %s-%s-%s", date_year, date_month, date_day)
+
+    def _feed_section_body(self, entry: str) -> None:
+        if self._mode == _WING_LIST:
+            if entry not in self.wing_sections:
+                self.wing_sections.append(sys.intern(entry))
+                logger.debug("Registered wing section %s", entry)
+        elif self._mode == _WING:
+            self._feed_wing_detail(entry)
+        elif self._mode == _CHIEFS:
+            fields = entry.split()
+            if "ShipPack" in entry:
+                logger.warning("Possible ShipPack mismatch detected in line: %s", entry)
+            if len(fields) > 1:
+                # Armor.1-BT7, Ships.Bismarck: the section name in chief.ini
+                chief = sys.intern(fields[1])
+                self._chiefs.add(chief)
+                logger.debug("Registered chief %s", chief)
+        elif self._mode == _NSTATIONARY:
+            fields = entry.split()
+            if len(fields) > 1:
+                stationary_name = sys.intern(fields[1])
+                self._stationaries.add(stationary_name)
+                lower_stationary = stationary_name.lower()
+                if "vehicles.planes" in lower_stationary:
+                    if (len(fields) >= 2 and fields[-1].lower() == "null") or (
+                        len(fields) >= 3 and fields[-1] == "0" and fields[-2].lower() == "null"
+                    ):
+                        self._stat_planes_without_markings.append(stationary_name)
+                        logger.debug(
+                            "Stationary plane without markings found: %s",
+                            stationary_name,
+                        )
+        elif self._mode == _BUILDINGS:
+            fields = entry.split()
+            if len(fields) > 1:
+                self._buildings.append(sys.intern(fields[1]))
+                logger.debug("Registered static object %s", fields[1])
+
+    def _feed_wing_detail(self, detail: str) -> None:
+        lower_detail = detail.lower()
+        if lower_detail.startswith("skin"):
+            parts = detail.split(maxsplit=1)
+            if len(parts) == 2:
+                self._skin_set.add(sys.intern(parts[1]))
+        elif lower_detail.startswith("class"):
+            parts = detail.split(maxsplit=1)
+            raw_value = parts[1] if len(parts) > 1 else ""
+            dot_index = raw_value.find(".")
+            if dot_index != -1:
+                self._aircraft_code = raw_value[dot_index + 1 :].split()[0]
             else:
-                logger.warning("[Season] section incomplete")
-            idx += 3
-            continue
-
-        if lower_line == "[wing]":
-            while idx < total_lines:
-                candidate = lines[idx].strip()
-                if not candidate:
-                    idx += 1
-                    continue
-                if candidate.startswith("["):
-                    break
-                if candidate not in wing_sections:
-                    wing_sections.append(candidate)
-                    logger.debug("Registered wing section %s", candidate)
-                idx += 1
-            continue
-
-        if lower_line.startswith("[") and lower_line.endswith("]"):
-            section_name = lower_line[1:-1]
-            if section_name in wing_sections:
-                skin_set: set[str] = set()
-                aircraft_code = ""
-
-                while idx < total_lines:
-                    detail = lines[idx].strip()
-                    if not detail:
-                        idx += 1
-                        continue
-                    if detail.startswith("["):
-                        break
-
-                    lower_detail = detail.lower()
-                    if lower_detail.startswith("skin"):
-                        parts = detail.split(maxsplit=1)
-                        if len(parts) == 2:
-                            skin_set.add(parts[1])
-                    elif lower_detail.startswith("class"):
-                        parts = detail.split(maxsplit=1)
-                        raw_value = parts[1] if len(parts) > 1 else ""
-                        dot_index = raw_value.find(".")
-                        if dot_index != -1:
-                            aircraft_code = raw_value[dot_index + 1 :].split()[0]
-                        else:
-                            aircraft_code = raw_value.split()[0]
-                    elif lower_detail.startswith("weapons"):
-                        weapon_code = detail.split()[-1]
-                        if aircraft_code:
-                            aircraft_entries.append(
-                                MissionAircraft(
-                                    aircraft_code=aircraft_code.strip(),
-                                    weapon_code=weapon_code.strip(),
-                                    skins=frozenset(skin_set),
-                                )
-                            )
-                            logger.debug(
-                                "Recorded aircraft %s with weapon %s and %d skins",
-                                aircraft_code.strip(),
-                                weapon_code.strip(),
-                                len(skin_set),
-                            )
-                    idx += 1
-                continue
+                self._aircraft_code = raw_value.split()[0]
+        elif lower_detail.startswith("weapons"):
+            weapon_code = detail.split()[-1]
+            if self._aircraft_code:
+                self._aircraft_entries.append(
+                    MissionAircraft(
+                        aircraft_code=sys.intern(self._aircraft_code.strip()),
+                        weapon_code=sys.intern(weapon_code.strip()),
+                        skins=frozenset(self._skin_set),
+                    )
+                )
+                logger.debug(
+                    "Recorded aircraft %s with weapon %s and %d skins",
+                    self._aircraft_code.strip(),
+                    weapon_code.strip(),
+                    len(self._skin_set),
+                )
+
+    def build(self) -> MissionData:
+        """Return the mission data once every line has been fed."""
+
+        mission_path = self.mission_path
+        if self._season_lines is not None:
+            logger.warning("[Season] section incomplete")
+        if self._awaiting_map:
+            logger.warning("[Main] section missing map entry in %s", mission_path)
+            sys.exit(1)
+
+        mission_date = None
+        if self._date is not None:
+            year, month, day = self._date
+            mission_date = MissionDate(year=year, month=month, day=day)
+
+        if not self.player_squadron:
+            logger.debug("Player squadron not found")
+        if self._map_name is None:
+            logger.debug("Map not detected")
+        if mission_date is None:
+            logger.debug("Date not fully specified")
+
+        logger.debug(
+            "Mission summary for %s: aircraft=%d, chiefs=%d, stationaries=%d, buildings=%d, wings=%d",
+            mission_path,
+            len(self._aircraft_entries),
+            len(self._chiefs),
+            len(self._stationaries),
+            len(self._buildings),
+            len(self.wing_sections),
+        )
+
+        return MissionData(
+            path=mission_path,
+            map_name=self._map_name,
+            date=mission_date,
+            date_is_custom=self._date_is_custom,
+            player_squadron=self.player_squadron,
+            aircraft=tuple(self._aircraft_entries),
+            chiefs=frozenset(self._chiefs),
+            stationaries=frozenset(self._stationaries),
+            buildings=tuple(self._buildings),
+            wing_sections=tuple(self.wing_sections),
+            stat_planes_without_markings=tuple(self._stat_planes_without_markings),
+        )
+
+
+def check_mission_exists(mission_path: Path) -> None:
+    """Stop the run when a mission listed in the campaign is missing."""
 
-        if lower_line == "[chiefs]":
-            while idx < total_lines:
-                entry = lines[idx].strip()
-                if not entry:
-                    idx += 1
-                    continue
-                if entry.startswith("["):
-                    break
-
-                fields = entry.split()
-                if "ShipPack" in entry:
-                    logger.warning("Possible ShipPack mismatch detected in line: %s", entry)
-                if len(fields) > 1:
-                    segment = fields[1]
-                    chief = segment.split(".", 1)[-1]
-                    chiefs_list.add(chief)
-                    logger.debug("Registered chief %s", chief)
-                idx += 1
-            continue
-
-        if lower_line == "[nstationary]":
-            while idx < total_lines:
-                entry = lines[idx].strip()
-                if not entry:
-                    idx += 1
-                    continue
-                if entry.startswith("["):
-                    break
-
-                fields = entry.split()
-                if len(fields) > 1:
-                    stationary_name = fields[1]
-                    stationaries_list.add(stationary_name)
-                    lower_stationary = stationary_name.lower()
-                    if "vehicles.planes" in lower_stationary:
-                        if (len(fields) >= 2 and fields[-1].lower() == "null") or (
-                            len(fields) >= 3 and fields[-1] == "0" and fields[-2].lower() == "null"
-                        ):
-                            stat_planes_without_markings.append(stationary_name)
-                            logger.debug(
-                                "Stationary plane without markings found: %s",
-                                stationary_name,
-                            )
-                idx += 1
-            continue
-
-        if lower_line == "[buildings]":
-            while idx < total_lines:
-                entry = lines[idx].strip()
-                if not entry:
-                    idx += 1
-                    continue
-                if entry.startswith("["):
-                    break
-
-                fields = entry.split()
-                if len(fields) > 1:
-                    buildings_list.append(fields[1])
-                    logger.debug("Registered static object %s", fields[1])
-                idx += 1
-            continue
-
-    mission_date = None
-    if date_year is not None and date_month is not None and date_day is not None:
-        mission_date = MissionDate(year=date_year, month=date_month, day=date_day)
-
-    if not player_sqdn:
-        logger.debug("Player squadron not found")
-    if map_name is None:
-        logger.debug("Map not detected")
-    if mission_date is None:
-        logger.debug("Date not fully specified")
-
-    logger.debug(
-        "Mission summary for %s: aircraft=%d, chiefs=%d, stationaries=%d, buildings=%d, wings=%d",
-        mission_path,
-        len(aircraft_entries),
-        len(chiefs_list),
-        len(stationaries_list),
-        len(buildings_list),
-        len(wing_sections),
-    )
-
-    return MissionData(
-        path=mission_path,
-        map_name=map_name,
-        date=mission_date,
-        date_is_custom=date_is_custom,
-        player_squadron=player_sqdn,
-        aircraft=tuple(aircraft_entries),
-        chiefs=frozenset(chiefs_list),
-        stationaries=frozenset(stationaries_list),
-        buildings=tuple(buildings_list),
-        wing_sections=tuple(wing_sections),
-        stat_planes_without_markings=tuple(stat_planes_without_markings),
-    )
+    # All the missions configured in the campaign should exits
+    if not mission_path.exists():
+        logger.error("Mission file not found: %s. Check the campaing file", mission_path)
+        sys.exit(1)
+
+
+@timed("read_mission")
+def read_mission(
+    mission_path: Path,
+    on_line: Callable[[MissionLine, MissionDataBuilder], None] | None = None,
+    contents: bytes | None = None,
+) -> MissionData:
+    """Read a mission file and extract relevant data.
+
+    The file is read once and decoded as UTF-8 or, for legacy missions,
+    Windows-1251. ``on_line`` is called for every line after the builder has
+    processed it, so other consumers (the auto-fix rewriter) can share the same
+    pass instead of reading the file again. ``contents`` are the bytes of the
+    file when they were already read (see :mod:`missions.prefetch`).
+    """
+
+    logger.info("Reading mission file %s", mission_path)
+    if contents is None:
+        check_mission_exists(mission_path)
+
+    builder = MissionDataBuilder(mission_path)
+    line_count = 0
+    handle, builder.encoding = open_text(mission_path) if contents is None else text_stream(contents, mission_path)
+    with handle:
+        for line_count, event in enumerate(iter_mission_lines(handle), 1):
+            builder.feed(event)
+            if on_line is not None:
+                on_line(event, builder)
+    count("mission lines parsed", line_count)
+    return builder.build()
+
+
+def parse_mission_text(mission_path: Path, text: str) -> MissionData:
+    """Extract the mission data from mission contents already in memory.
+
+    ``mission_path`` is only used to name the mission in the results.
+    """
+
+    builder = MissionDataBuilder(mission_path)
+    line_count = 0
+    for line_count, event in enumerate(iter_mission_lines(text.splitlines(keepends=True)), 1):
+        builder.feed(event)
+    count("mission lines parsed", line_count)
+    return builder.build()
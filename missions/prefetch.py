@@ -0,0 +1,152 @@
+"""Read-ahead of the mission files for the serial run.
+
+A background thread reads the next missions of the campaign while the main
+thread parses and checks the current one, so a slow disk (a network drive,
+an HDD) is read while the CPU is busy. The buffered missions are bounded both
+in number and in bytes; a mission larger than the memory cap is still read,
+once the missions before it have been consumed.
+"""
+
+import logging
+import threading
+import time
+
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+
+from .missions import MissionFile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEPTH = 4
+DEFAULT_MEMORY_MB = 64
+
+
+class MissionPrefetcher:
+    """Iterate over ``(mission_path, mission_file)`` pairs in campaign order.
+
+    ``mission_file`` is None when the mission could not be read ahead (missing or
+    unreadable), so the consumer reads it itself and reports the error as the
+    serial run does. With ``depth`` 0 nothing is read ahead.
+    """
+
+    def __init__(
+        self,
+        mission_paths: list[Path],
+        depth: int = DEFAULT_DEPTH,
+        memory_mb: int = DEFAULT_MEMORY_MB,
+    ) -> None:
+        self.mission_paths = mission_paths
+        self.depth = depth
+        self.memory_limit = max(memory_mb, 0) * 1024 * 1024
+        self._buffer: deque[tuple[Path, MissionFile | None]] = deque()
+        self._buffered_bytes = 0
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._finished = False
+        self._thread: threading.Thread | None = None
+        # Reader thread side
+        self.read_seconds = 0.0
+        self.read_bytes = 0
+        # Consumer side: blocked on the reader versus busy with the mission
+        self.wait_seconds = 0.0
+        self.process_seconds = 0.0
+
+    def __enter__(self) -> "MissionPrefetcher":
+        if self.depth > 0 and self.mission_paths:
+            self._thread = threading.Thread(target=self._read_ahead, name="mission-prefetch", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the reader thread, even when the missions were not all consumed."""
+        with self._condition:
+            self._stopped = True
+            self._buffer.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self.log_stats()
+
+    def _read_ahead(self) -> None:
+        try:
+            self._read_missions()
+        finally:
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
+
+    def _read_missions(self) -> None:
+        for mission_path in self.mission_paths:
+            try:
+                size = mission_path.stat().st_size
+            except OSError:
+                size = 0
+            with self._condition:
+                # An empty buffer always takes the next mission, whatever its size
+                self._condition.wait_for(
+                    lambda: self._stopped
+                    or not self._buffer
+                    or (len(self._buffer) < self.depth and self._buffered_bytes + size <= self.memory_limit)
+                )
+                if self._stopped:
+                    return
+
+            started = time.perf_counter()
+            try:
+                mission_file: MissionFile | None = MissionFile.read(mission_path)
+            except OSError as error:
+                logger.debug("Mission %s not read ahead: %s", mission_path, error)
+                mission_file = None
+            with self._condition:
+                self.read_seconds += time.perf_counter() - started
+                if mission_file is not None:
+                    self.read_bytes += len(mission_file.contents)
+                    self._buffered_bytes += len(mission_file.contents)
+                self._buffer.append((mission_path, mission_file))
+                self._condition.notify_all()
+
+    def _next_file(self) -> MissionFile | None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._buffer or self._finished)
+            if not self._buffer:
+                # The reader stopped early, the consumer reads the rest itself
+                return None
+            _, mission_file = self._buffer.popleft()
+            if mission_file is not None:
+                self._buffered_bytes -= len(mission_file.contents)
+            self._condition.notify_all()
+        return mission_file
+
+    def __iter__(self) -> Iterator[tuple[Path, MissionFile | None]]:
+        for mission_path in self.mission_paths:
+            if self._thread is None:
+                yield mission_path, None
+                continue
+            started = time.perf_counter()
+            mission_file = self._next_file()
+            self.wait_seconds += time.perf_counter() - started
+            started = time.perf_counter()
+            yield mission_path, mission_file
+            self.process_seconds += time.perf_counter() - started
+
+    def log_stats(self) -> None:
+        """Log the time spent reading, waiting for the reader and processing the missions."""
+        logger.info(
+            "Mission prefetch | read=%.2fs (%.1f MB) | waited=%.2fs | processing=%.2fs",
+            self.read_seconds,
+            self.read_bytes / (1024 * 1024),
+            self.wait_seconds,
+            self.process_seconds,
+        )
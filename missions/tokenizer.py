@@ -0,0 +1,41 @@
+"""Streaming tokenizer for mission (.mis) files."""
+
+from typing import Iterable, Iterator, NamedTuple
+
+
+class MissionLine(NamedTuple):
+    """One line of a mission file.
+
+    ``section`` is the name of the section the line belongs to, as written in
+    the file and without brackets ("" before the first header). ``key`` is the
+    first token of the line: the bracketed header itself for section headers,
+    "" for blank lines. ``raw_line`` is the line exactly as read, newline
+    included, so consumers can copy it through unchanged.
+    """
+
+    section: str
+    key: str
+    raw_line: str
+
+    @property
+    def is_header(self) -> bool:
+        """True for the ``[Section]`` line that opens ``section``."""
+        return self.key.startswith("[") and self.key.endswith("]") and self.key[1:-1] == self.section
+
+
+def iter_mission_lines(lines: Iterable[str]) -> Iterator[MissionLine]:
+    """Yield one :class:`MissionLine` per line read from ``lines`` (usually a file handle)."""
+
+    section = ""
+    for raw_line in lines:
+        stripped = raw_line.strip()
+        if not stripped:
+            yield MissionLine(section, "", raw_line)
+            continue
+
+        if stripped.startswith("[") and stripped.endswith("]") and len(stripped) >= 2:
+            section = stripped[1:-1]
+            yield MissionLine(section, stripped, raw_line)
+            continue
+
+        yield MissionLine(section, stripped.split(maxsplit=1)[0], raw_line)
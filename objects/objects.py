@@ -1,9 +1,18 @@
 """Helpers for loading static object identifiers."""
 
+import mmap
+
 from pathlib import Path
 from typing import Iterable, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
+from resources.text_decoding import LinePattern, decode_identifiers
+
+
+# Lines starting with "[b" (the [buildings.*] headers) after the indentation
+_OBJECT_HEADER = LinePattern(rb"[ \t\x0b\x0c\x1c-\x1f]*(\[b[^\r\n]*)")
+_TRAILING_WHITESPACE = b" \t\x0b\x0c\x1c\x1d\x1e\x1f"
 
 
 def _iter_object_lines(lines: Iterable[str]) -> Iterable[str]:
@@ -20,6 +29,14 @@ def _parse_objects(handle: TextIO) -> list[str]:
     return objects
 
 
+def _parse_objects_mapped(data: mmap.mmap, resource_path: Path) -> list[str]:
+    """Same result as :func:`_parse_objects`, searching the raw bytes for the headers."""
+
+    raw_headers = [header.rstrip(_TRAILING_WHITESPACE) for header in _OBJECT_HEADER.find_groups(data)]
+    return [header[11:-1] for header in decode_identifiers(raw_headers, data, resource_path)]
+
+
+@timed("read_objects")
 def read_objects(root: str | Path) -> list[str]:
     """Return the list of static object identifiers."""
 
@@ -28,4 +45,5 @@ def read_objects(root: str | Path) -> list[str]:
         ("com", "maddox", "il2", "objects", "static.ini"),
         _parse_objects,
         "static objects",
+        bytes_parser=_parse_objects_mapped,
     )
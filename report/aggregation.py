@@ -0,0 +1,186 @@
+""" Campaign-wide index of the assets used and missing in every mission """
+
+import json
+import logging
+import os
+
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .findings import Category, Severity
+
+if TYPE_CHECKING:
+    from analyzer.analyzer import MissionReport
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "_campaign_index.json"
+FIX_PRIORITY_FILE_NAME = "CampaignFixPriority.txt"
+INDEX_VERSION = 1
+
+# Kinds of assets recorded in the usage index
+MAP = "map"
+AIRCRAFT = "aircraft"
+SKIN = "skin"
+WEAPON = "weapon"
+WING = "wing"
+CHIEF = "chief"
+STATIONARY = "stationary"
+OBJECT = "object"
+
+# (identifier, detail) of a finding, e.g. ("zz.bmp", "BF_109G6") for a missing skin
+IssueKey = tuple[str, str]
+
+
+class CampaignIndex:
+    """
+    Inverted index: asset -> missions using it, finding -> missions reporting it.
+    The index is filled in one pass while the mission reports are produced and
+    answers the campaign-level questions (most used missing objects, missions
+    affected by a missing skin, ...) without parsing the missions again.
+    Missions are stored once, by position, in campaign order.
+    """
+
+    def __init__(self) -> None:
+        self.missions: list[str] = []
+        self.usage: defaultdict[str, defaultdict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+        self.issues: defaultdict[Category, defaultdict[IssueKey, list[int]]] = defaultdict(lambda: defaultdict(list))
+        self.severities: dict[Category, Severity] = {}
+
+    def add(self, mission_report: "MissionReport") -> None:
+        """ Record the assets used by a mission and the findings reported for it """
+        position = len(self.missions)
+        self.missions.append(mission_report.mission_name)
+
+        mission_data = mission_report.mission_data
+        used: dict[str, set[str]] = {
+            MAP: {mission_data.map_name} if mission_data.map_name else set(),
+            AIRCRAFT: {aircraft.aircraft_code for aircraft in mission_data.aircraft},
+            SKIN: {skin for aircraft in mission_data.aircraft for skin in aircraft.skins},
+            WEAPON: {aircraft.weapon_code for aircraft in mission_data.aircraft},
+            WING: set(mission_data.wing_sections),
+            CHIEF: set(mission_data.chiefs),
+            STATIONARY: set(mission_data.stationaries),
+            OBJECT: set(mission_data.buildings),
+        }
+        for kind, names in used.items():
+            kind_usage = self.usage[kind]
+            # Sorted so the saved index does not depend on the set iteration order
+            for name in sorted(names):
+                kind_usage[name].append(position)
+
+        # A finding may be repeated in a mission (two wings with the same missing skin)
+        reported = dict.fromkeys(
+            (finding.category, finding.identifier, finding.detail, finding.severity)
+            for finding in mission_report.findings
+            if finding.severity != Severity.INFO
+        )
+        for category, identifier, detail, severity in reported:
+            self.issues[category][(identifier, detail)].append(position)
+            self.severities[category] = severity
+
+    def missing(self, category: Category) -> set[str]:
+        """ Identifiers reported with ``category`` in at least one mission """
+        return {identifier for identifier, _ in self.issues.get(category, {})}
+
+    def missions_using(self, kind: str, name: str) -> list[str]:
+        """ Missions using the asset ``name`` of the given kind """
+        return [self.missions[position] for position in self.usage.get(kind, {}).get(name, [])]
+
+    def missions_reporting(self, category: Category, identifier: str) -> list[str]:
+        """ Missions with a finding of ``category`` for ``identifier`` (any detail) """
+        positions: set[int] = set()
+        for (issue_identifier, _), issue_positions in self.issues.get(category, {}).items():
+            if issue_identifier == identifier:
+                positions.update(issue_positions)
+        return [self.missions[position] for position in sorted(positions)]
+
+    def ranked_issues(self, category: Category) -> list[tuple[IssueKey, int]]:
+        """ Issues of ``category``, the ones affecting most missions first """
+        return sorted(
+            ((key, len(positions)) for key, positions in self.issues.get(category, {}).items()),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+    def find(self, name: str) -> tuple[dict[str, list[str]], dict[Category, list[str]]]:
+        """ Missions using ``name`` (by asset kind) and reporting it (by finding category) """
+        using = {kind: self.missions_using(kind, name) for kind in self.usage if name in self.usage[kind]}
+        reporting = {
+            category: missions
+            for category in self.issues
+            if (missions := self.missions_reporting(category, name))
+        }
+        return using, reporting
+
+    def to_json(self) -> dict:
+        """ Return the index as JSON data """
+        return {
+            "version": INDEX_VERSION,
+            "missions": self.missions,
+            "usage": self.usage,
+            "issues": {
+                category: [[identifier, detail, positions] for (identifier, detail), positions in keys.items()]
+                for category, keys in self.issues.items()
+            },
+            "severities": self.severities,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CampaignIndex":
+        """ Rebuild an index saved with :meth:`to_json` """
+        index = cls()
+        index.missions = data["missions"]
+        for kind, names in data["usage"].items():
+            index.usage[kind].update(names)
+        for category, entries in data["issues"].items():
+            for identifier, detail, positions in entries:
+                index.issues[Category(category)][(identifier, detail)] = positions
+        for category, severity in data["severities"].items():
+            index.severities[Category(category)] = Severity(severity)
+        return index
+
+    def save(self, path: Path) -> None:
+        """ Write the index next to the report """
+        temporary_path = path.with_suffix(".tmp")
+        with temporary_path.open("w", encoding="utf-8") as handle:
+            json.dump(self.to_json(), handle, ensure_ascii=False)
+        os.replace(temporary_path, path)
+        logger.debug("Campaign index written to %s", path)
+
+    @classmethod
+    def load(cls, path: Path) -> "CampaignIndex | None":
+        """ Read a saved index, None when it is missing or from another version """
+        try:
+            with path.open(encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as error:
+            logger.error("Can not read the campaign index %s: %s", path, error)
+            return None
+        if data.get("version") != INDEX_VERSION:
+            logger.error("Campaign index %s was written by another version, run the analyzer again", path)
+            return None
+        return cls.from_json(data)
+
+
+def format_fix_priority(index: CampaignIndex) -> str:
+    """
+    Return the issues of the campaign ranked by the number of missions they affect,
+    errors first, so the fixes helping most missions are done first.
+    """
+    lines = [f"Fix priority - {len(index.missions)} missions", ""]
+    severity_order = {Severity.ERROR: 0, Severity.WARNING: 1, Severity.INFO: 2}
+    categories = sorted(
+        index.issues,
+        key=lambda category: (severity_order[index.severities[category]], category),
+    )
+    for category in categories:
+        ranked = index.ranked_issues(category)
+        lines.append(f"### {category} ({len(ranked)})")
+        for (identifier, detail), mission_count in ranked:
+            name = f"{identifier} ({detail})" if detail else identifier or "-"
+            lines.append(f"{mission_count:>6} missions  {name}")
+        lines.append("")
+    if not categories:
+        lines.append("Nothing to fix")
+    return "\n".join(lines).rstrip("\n") + "\n"
@@ -0,0 +1,63 @@
+""" Typed findings produced by the mission checks """
+
+from dataclasses import dataclass, fields
+from enum import StrEnum
+
+
+class Severity(StrEnum):
+    """ How much a finding affects the mission """
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+class Category(StrEnum):
+    """ Kind of finding; the values are the ones written to the JSON Lines / CSV reports """
+    MISSION_DATE_NOT_SET = "mission_date_not_set"
+    AIRCRAFT_USED = "aircraft_used"
+    WING_USED = "wing_used"
+    CHIEF_USED = "chief_used"
+    STATIONARY_USED = "stationary_used"
+    MISSING_MAP = "missing_map"
+    MISSING_AIRCRAFT = "missing_aircraft"
+    MISSING_SKIN = "missing_skin"
+    MISSING_WEAPON = "missing_weapon"
+    MISSING_CHIEF = "missing_chief"
+    MISSING_STATIONARY = "missing_stationary"
+    MISSING_WING = "missing_wing"
+    MISSING_OBJECT = "missing_object"
+    PLANE_WITHOUT_MARKINGS = "plane_without_markings"
+
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """
+    One result of the mission checks.
+    ``detail`` gives context when the identifier alone is ambiguous,
+    e.g. the aircraft a missing skin or weapon belongs to.
+    """
+    mission: str
+    category: Category
+    identifier: str
+    severity: Severity
+    detail: str = ""
+
+
+FINDING_FIELDS = tuple(field.name for field in fields(Finding))
+
+
+def finding_record(finding: Finding) -> dict[str, str]:
+    """ Return the finding as a JSON serializable dict """
+    return {name: getattr(finding, name) for name in FINDING_FIELDS}
+
+
+class FindingRecorder:
+    """ Collect the findings of one mission in the order the checks report them """
+
+    def __init__(self, mission: str) -> None:
+        self.mission = mission
+        self.findings: list[Finding] = []
+
+    def add(self, category: Category, identifier: str, severity: Severity, detail: str = "") -> None:
+        """ Record a finding for the mission """
+        self.findings.append(Finding(self.mission, category, identifier, severity, detail))
@@ -5,123 +5,129 @@ import logging
 from pathlib import Path
 from typing import Tuple
 
+from catalog.catalog import AssetCatalog
+from instrumentation.instrumentation import count, timed
 from missions.mission_data import MissionAircraft
+from .findings import Category, FindingRecorder, Severity
+from .static_index import StaticSectionIndex
 
 logger = logging.getLogger(__name__)
 
 
-def log_used_aircrafts(aircrafts: list[str], full_report: bool) -> None:
+@timed("log_used_aircrafts")
+def log_used_aircrafts(aircrafts: list[str], full_report: bool, findings: FindingRecorder) -> None:
     """ Log the aircrafts used in a mission """
     used_aircraft = sorted({entry.aircraft_code for entry in aircrafts})
 
     if full_report:
-        if used_aircraft:
-            print("Aircraft used:\n" + "\n".join(f"\t{code}" for code in used_aircraft))
-        else:
-            print("Aircraft used:\n\tNone")
+        for code in used_aircraft:
+            findings.add(Category.AIRCRAFT_USED, code, Severity.INFO)
 
 
-def log_squadrons(wing_sections: list[str], full_report: bool) -> None:
+@timed("log_squadrons")
+def log_squadrons(wing_sections: list[str], full_report: bool, findings: FindingRecorder) -> None:
     """ Log the Wings used in a mission """
     sorted_wings = sorted({entry for entry in wing_sections})
 
     if full_report:
-        if sorted_wings:
-            print("Wings:\n" + "\n".join(f"\t{wing}" for wing in sorted_wings))
-        else:
-            print("Wings used:\n\tNone")
-
-
-def log_chiefs(chiefs: list[str], full_report: bool) -> None:
-    """ Log the defined chiefs in a mission """
+        for wing in sorted_wings:
+            findings.add(Category.WING_USED, wing, Severity.INFO)
+
+
+@timed("log_chiefs")
+def log_chiefs(
+    chiefs: frozenset[str],
+    catalog: AssetCatalog,
+    full_report: bool,
+    findings: FindingRecorder,
+) -> frozenset[str]:
+    """ Log the defined chiefs in a mission and the ones missing from chief.ini """
     sorted_chiefs = sorted(chiefs)
 
     if full_report:
-        if sorted_chiefs:
-            print("Chiefs used:\n" + "\n".join(f"\t{chief}" for chief in sorted_chiefs))
-        else:
-            print("Chiefs used:\n\tNone")
-
-    for chief in sorted_chiefs:
-        if chief not in chiefs:
-            print(f"###Chief {chief} not found!")
-
-
-def log_stationaries(stationaries: list[str], full_report: bool) -> None:
-    """ Log the defined stationaries in a mission """
+        for chief in sorted_chiefs:
+            findings.add(Category.CHIEF_USED, chief, Severity.INFO)
+
+    count("catalog lookups", len(chiefs))
+    missing_chiefs = chiefs - catalog.chiefs
+    for chief in sorted(missing_chiefs):
+        findings.add(Category.MISSING_CHIEF, chief, Severity.ERROR)
+    return missing_chiefs
+
+
+@timed("log_stationaries")
+def log_stationaries(
+    stationaries: frozenset[str],
+    catalog: AssetCatalog,
+    full_report: bool,
+    findings: FindingRecorder,
+) -> frozenset[str]:
+    """ Log the defined stationaries in a mission and the ones missing from stationary.ini or air.ini """
     sorted_stationaries = sorted(stationaries)
 
     if full_report:
-        if sorted_stationaries:
-            print(
-                "Stationaries used: \n" + "\n".join(f"\t{item}" for item in sorted_stationaries)
-            )
-        else:
-            print("Stationaries used: \n\tNone")
+        for stationary in sorted_stationaries:
+            findings.add(Category.STATIONARY_USED, stationary, Severity.INFO)
 
-    for stationary in sorted_stationaries:
-        if stationary not in stationaries:
-            print(f"###Stationary {stationary} not found!")
+    count("catalog lookups", len(stationaries))
+    missing_stationaries = catalog.missing_stationaries(stationaries)
+    for stationary in sorted(missing_stationaries):
+        findings.add(Category.MISSING_STATIONARY, stationary, Severity.ERROR)
+    return missing_stationaries
 
 
+@timed("log_planes_details")
 def log_planes_details(
     aircrafts: Tuple[MissionAircraft, ...],
-    aircraft_classes: list[str],
-    skins: dict[str, list[str]],
-    weapons: dict[str, list[str]],
+    catalog: AssetCatalog,
+    findings: FindingRecorder,
 ) -> set[str]:
     """ Log the details for the aircrafts in a mission """
     missing_aircrafts: set[str] = set()
 
-    print("### Aircrafts - Not found:")
     for aircraft in aircrafts:
         aircraft_code = aircraft.aircraft_code
-        aircraft_name = aircraft_classes.get(aircraft_code)
+        aircraft_name = catalog.aircraft_name(aircraft_code)
+        count("catalog lookups")
         if aircraft_name is None:
-            print(f"\t{aircraft_code}")
-            missing_aircrafts.add(aircraft_name)
+            findings.add(Category.MISSING_AIRCRAFT, aircraft_code, Severity.ERROR)
+            missing_aircrafts.add(aircraft_code)
             continue
 
-        skin_key = aircraft_name.lower()
-        available_skins = skins.get(skin_key)
-        print("### Skins - Missing:")
-        for skin in sorted(aircraft.skins):
-            if not available_skins or skin not in available_skins:
-                print(f"\t{skin} for {aircraft_code}")
+        available_skins = catalog.skins_for(aircraft_name)
+        for skin in sorted(aircraft.skins - available_skins):
+            findings.add(Category.MISSING_SKIN, skin, Severity.WARNING, aircraft_code)
 
-        weapon_options = weapons.get(aircraft_name)
-        if weapon_options is None or aircraft.weapon_code not in weapon_options:
-            print(f"\t - {aircraft_code}: Weapon {aircraft.weapon_code} not found")
+        count("catalog lookups", len(aircraft.skins) + 1)
+        if not catalog.has_weapon(aircraft_name, aircraft.weapon_code):
+            findings.add(Category.MISSING_WEAPON, aircraft.weapon_code, Severity.ERROR, aircraft_code)
 
     return missing_aircrafts
 
 
-def log_planes_without_markings(stat_planes_without_markings: list[str]) -> None:
+@timed("log_planes_without_markings")
+def log_planes_without_markings(stat_planes_without_markings: list[str], findings: FindingRecorder) -> None:
     """ Log the planes without markings in a mission """
     stat_planes_without_markings = sorted(set(stat_planes_without_markings))
-    if stat_planes_without_markings:
-        print("### Stationary planes without markings:")
-        for stat_plane_name in stat_planes_without_markings:
-            print(f"\t{stat_plane_name}")
+    for stat_plane_name in stat_planes_without_markings:
+        findings.add(Category.PLANE_WITHOUT_MARKINGS, stat_plane_name, Severity.WARNING)
 
 
-def log_buildings(buildings: list[str], objects: list[str]) -> set[str]:
+@timed("log_buildings")
+def log_buildings(buildings: list[str], catalog: AssetCatalog, findings: FindingRecorder) -> set[str]:
     """ Log the missing buildings in a mission """
-    missing_buildings = set()
+    unique_buildings = set(buildings)
+    count("catalog lookups", len(unique_buildings))
+    missing_buildings = unique_buildings - catalog.objects
 
-
-    for building in sorted(buildings):
-        if building not in objects:
-            missing_buildings.add(building)
-
-    print("### Static objects - Not found")
     for building in sorted(list(missing_buildings)):
-        print(f"\t{building}")
+        findings.add(Category.MISSING_OBJECT, building, Severity.ERROR)
 
     # TODO: Improve the method
     return set(sorted(list(missing_buildings)))
 
 
+@timed("generate_missing_objects_ini")
 def generate_missing_objects_ini(
         missing_objects: set[str],
         output_directory: Path
@@ -142,34 +148,7 @@ def generate_missing_objects_ini(
         logging.error("Base static.ini not found at %s", base_ini_path)
         return
 
-    # Read entire base/static.ini and build a map of section name -> section text
-    # Sections are of the form [section.name] and continue until the next section header
-    sections: dict[str, list[str]] = {}
-    current_section_name: str | None = None
-    current_section_lines: list[str] = []
-
-    with base_ini_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            stripped = line.strip()
-            if stripped.startswith("[") and stripped.endswith("]") and len(stripped) > 2:
-                # Commit previous section if present
-                if current_section_name is not None:
-                    sections[current_section_name] = current_section_lines[:]
-
-                # Start new section
-                current_section_name = stripped[1:-1]
-                current_section_lines = [line]  # include header line with original formatting
-            else:
-                # Accumulate lines for the current section (and preamble comments too if any)
-                if current_section_name is not None:
-                    current_section_lines.append(line)
-                else:
-                    # Lines before the first section are ignored for lookup
-                    pass
-
-        # Commit the last section if file ended during a section
-        if current_section_name is not None:
-            sections[current_section_name] = current_section_lines[:]
+    index = StaticSectionIndex.load(base_ini_path)
 
     # Normalize requested object names: they may come either as full section keys
     # (e.g., buildings.House$Wickerchair) or already bracketed. We'll strip brackets if present.
@@ -180,6 +159,7 @@ def generate_missing_objects_ini(
         return n
 
     normalized_missing = [normalize(x) for x in sorted(missing_objects)]
+    sections = index.read_sections(["buildings." + key for key in normalized_missing])
 
     # Write output file with the corresponding sections
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -196,7 +176,7 @@ def generate_missing_objects_ini(
             # Ensure separation between sections
             if wrote_any:
                 out.write("\n")
-            out.writelines(section)
+            out.write(section)
             wrote_any = True
 
     if wrote_any:
@@ -205,7 +185,7 @@ def generate_missing_objects_ini(
         print("### No matching sections found to write.")
 
 
-def _convert_wing_to_reg(wing: str) -> str:
+def convert_wing_to_reg(wing: str) -> str:
     """
     Convert the wing value to regInfo.propertie format
     Examples:
@@ -220,17 +200,12 @@ def _convert_wing_to_reg(wing: str) -> str:
     return wing[0:-2]
 
 
-def log_missing_squadrons(wing_sections: list[str], squadrons: list[str]) -> None:
+@timed("log_missing_squadrons")
+def log_missing_squadrons(wing_sections: list[str], catalog: AssetCatalog, findings: FindingRecorder) -> None:
     """ Log the missing Wings """
-    missing_wings = set()
-
-    for wing in wing_sections:
-        squadron = _convert_wing_to_reg(wing)
-        if squadron not in squadrons:
-            missing_wings.add(squadron)
-
+    squadrons = {convert_wing_to_reg(wing) for wing in wing_sections}
+    count("catalog lookups", len(squadrons))
+    missing_wings = squadrons - catalog.squadrons
 
-    if missing_wings:
-        print("### Wings - Not configured")
-        for wing in missing_wings:
-            print(f"Wing: {wing}")
+    for wing in sorted(missing_wings):
+        findings.add(Category.MISSING_WING, wing, Severity.WARNING)
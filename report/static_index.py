@@ -0,0 +1,112 @@
+"""Byte-offset index of the sections of a static.ini file."""
+
+import json
+import logging
+import mmap
+import os
+
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the persisted index changes
+INDEX_FORMAT_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+
+def _is_section_header(stripped: bytes) -> bool:
+    return stripped.startswith(b"[") and stripped.endswith(b"]") and len(stripped) > 2
+
+
+def _normalize_newlines(text: str) -> str:
+    # Same result as reading the file in text mode (universal newlines)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class StaticSectionIndex:
+    """Map section names to the ``(offset, length)`` of their bytes in the file.
+
+    A section starts at its header line and runs until the next header, so its
+    bytes can be copied verbatim. The index is persisted next to the ini file
+    and is only rebuilt when the file size or modification time changes.
+    """
+
+    def __init__(self, ini_path: Path, sections: dict[str, tuple[int, int]]) -> None:
+        self.ini_path = ini_path
+        self.sections = sections
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.sections
+
+    @classmethod
+    def build(cls, ini_path: Path) -> "StaticSectionIndex":
+        """Scan ``ini_path`` once and record where every section lives."""
+
+        sections: dict[str, tuple[int, int]] = {}
+        current_name: str | None = None
+        current_start = 0
+        offset = 0
+
+        with ini_path.open("rb") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if _is_section_header(stripped):
+                    if current_name is not None:
+                        sections[current_name] = (current_start, offset - current_start)
+                    current_name = stripped[1:-1].decode("utf-8")
+                    current_start = offset
+                offset += len(line)
+
+        if current_name is not None:
+            sections[current_name] = (current_start, offset - current_start)
+
+        logger.debug("Indexed %d sections in %s", len(sections), ini_path)
+        return cls(ini_path, sections)
+
+    @classmethod
+    def load(cls, ini_path: Path) -> "StaticSectionIndex":
+        """Return the persisted index for ``ini_path``, rebuilding it if stale."""
+
+        index_path = ini_path.with_name(ini_path.name + INDEX_SUFFIX)
+        stat = ini_path.stat()
+        stamp = [INDEX_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size]
+
+        try:
+            with index_path.open(encoding="utf-8") as handle:
+                stored = json.load(handle)
+            if stored.get("stamp") == stamp:
+                logger.debug("Using section index %s", index_path)
+                sections = {name: (span[0], span[1]) for name, span in stored["sections"].items()}
+                return cls(ini_path, sections)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as error:
+            logger.warning("Ignoring unreadable section index %s: %s", index_path, error)
+
+        index = cls.build(ini_path)
+        temporary_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            with temporary_path.open("w", encoding="utf-8") as handle:
+                json.dump({"stamp": stamp, "sections": index.sections}, handle)
+            os.replace(temporary_path, index_path)
+        except OSError as error:
+            logger.warning("Could not write section index %s: %s", index_path, error)
+        return index
+
+    def read_sections(self, names: list[str]) -> dict[str, str]:
+        """Return the text of the requested sections that exist in the file."""
+
+        spans = {name: self.sections[name] for name in names if name in self.sections}
+        if not spans:
+            return {}
+
+        texts: dict[str, str] = {}
+        with self.ini_path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for name, (offset, length) in spans.items():
+                texts[name] = _normalize_newlines(mapped[offset:offset + length].decode("utf-8"))
+        return texts
@@ -0,0 +1,193 @@
+""" Pluggable writers for the campaign report: text, JSON Lines and CSV """
+
+import csv
+import json
+import logging
+import sys
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config.app_settings import AppSettings
+from .findings import FINDING_FIELDS, Category, finding_record
+
+if TYPE_CHECKING:
+    from analyzer.analyzer import MissionReport
+
+logger = logging.getLogger(__name__)
+
+# Large buffers keep the number of writes low on campaigns with many findings
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def format_mission_text(mission_report: "MissionReport") -> str:
+    """
+    Render the mission section of the text report from the findings
+    and the mission data, in the order the checks run.
+    """
+    mission_data = mission_report.mission_data
+    full_report = mission_report.full_report
+    by_category: defaultdict[Category, list[str]] = defaultdict(list)
+    for finding in mission_report.findings:
+        by_category[finding.category].append(finding.identifier)
+
+    def used(title: str, category: Category, empty_title: str | None = None) -> None:
+        if not full_report:
+            return
+        identifiers = by_category[category]
+        if identifiers:
+            lines.append(title + "\n" + "\n".join(f"\t{identifier}" for identifier in identifiers))
+        else:
+            lines.append((empty_title or title) + "\n\tNone")
+
+    lines = [f"Reading mission {mission_report.mission_name}"]
+    if mission_data.map_name:
+        lines.append(f"Mission Map = {mission_data.map_name}")
+        if mission_report.missing_map:
+            lines.append(f"Missing Map = {mission_report.missing_map}")
+
+    if mission_data.date and mission_data.date_is_custom:
+        mission_date = mission_data.date
+        lines.append(f"Mission Date: {mission_date.year}-{mission_date.month}-{mission_date.day}")
+    else:
+        lines.append("###Mission Date not set")
+
+    used("Aircraft used:", Category.AIRCRAFT_USED)
+    used("Wings:", Category.WING_USED, "Wings used:")
+    used("Chiefs used:", Category.CHIEF_USED)
+    lines.extend(f"###Chief {chief} not found!" for chief in by_category[Category.MISSING_CHIEF])
+    used("Stationaries used: ", Category.STATIONARY_USED)
+    lines.extend(
+        f"###Stationary {stationary} not found!" for stationary in by_category[Category.MISSING_STATIONARY]
+    )
+
+    # Skins and weapons are checked per aircraft type, so each wing shows its own subset
+    missing_skins: defaultdict[str, set[str]] = defaultdict(set)
+    missing_weapons: defaultdict[str, set[str]] = defaultdict(set)
+    for finding in mission_report.findings:
+        if finding.category is Category.MISSING_SKIN:
+            missing_skins[finding.detail].add(finding.identifier)
+        elif finding.category is Category.MISSING_WEAPON:
+            missing_weapons[finding.detail].add(finding.identifier)
+    lines.append("### Aircrafts - Not found:")
+    for aircraft in mission_data.aircraft:
+        aircraft_code = aircraft.aircraft_code
+        if aircraft_code in mission_report.missing_aircrafts:
+            lines.append(f"\t{aircraft_code}")
+            continue
+        lines.append("### Skins - Missing:")
+        lines.extend(
+            f"\t{skin} for {aircraft_code}" for skin in sorted(aircraft.skins & missing_skins[aircraft_code])
+        )
+        if aircraft.weapon_code in missing_weapons[aircraft_code]:
+            lines.append(f"\t - {aircraft_code}: Weapon {aircraft.weapon_code} not found")
+
+    if by_category[Category.PLANE_WITHOUT_MARKINGS]:
+        lines.append("### Stationary planes without markings:")
+        lines.extend(f"\t{name}" for name in by_category[Category.PLANE_WITHOUT_MARKINGS])
+    if by_category[Category.MISSING_WING]:
+        lines.append("### Wings - Not configured")
+        lines.extend(f"Wing: {wing}" for wing in by_category[Category.MISSING_WING])
+    lines.append("### Static objects - Not found")
+    lines.extend(f"\t{building}" for building in by_category[Category.MISSING_OBJECT])
+
+    return "\n".join(lines) + "\n\n"
+
+
+class ReportWriter(ABC):
+    """
+    Write the report of each mission as soon as it is available,
+    so memory does not grow with the size of the campaign.
+    """
+    # Extension replacing the one of the text report, None for the text report itself
+    suffix: str | None = None
+    newline: str | None = None
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.stream = path.open("w", encoding="utf-8", newline=self.newline, buffering=WRITE_BUFFER_SIZE)
+
+    @abstractmethod
+    def write_mission(self, mission_report: "MissionReport") -> None:
+        """ Write the results of one mission """
+
+    def close(self) -> None:
+        """ Flush and close the report file """
+        self.stream.close()
+
+
+class TextReportWriter(ReportWriter):
+    """ The human readable report (CampaignAnalyzerOutput.txt) """
+
+    def write_mission(self, mission_report: "MissionReport") -> None:
+        self.stream.write(format_mission_text(mission_report))
+
+
+class JsonLinesReportWriter(ReportWriter):
+    """ One JSON object per finding """
+    suffix = ".jsonl"
+
+    def write_mission(self, mission_report: "MissionReport") -> None:
+        for finding in mission_report.findings:
+            self.stream.write(json.dumps(finding_record(finding), ensure_ascii=False))
+            self.stream.write("\n")
+
+
+class CsvReportWriter(ReportWriter):
+    """ One row per finding, with a header row """
+    suffix = ".csv"
+    newline = ""  # the csv module writes its own line endings
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._writer = csv.writer(self.stream)
+        self._writer.writerow(FINDING_FIELDS)
+
+    def write_mission(self, mission_report: "MissionReport") -> None:
+        self._writer.writerows(
+            [getattr(finding, name) for name in FINDING_FIELDS]
+            for finding in mission_report.findings
+        )
+
+
+REPORT_WRITERS: dict[str, type[ReportWriter]] = {
+    "text": TextReportWriter,
+    "jsonl": JsonLinesReportWriter,
+    "csv": CsvReportWriter,
+}
+
+
+def parse_report_outputs(report_outputs: str) -> list[str]:
+    """ Split the comma separated REPORT_OUTPUTS setting, e.g. "text,jsonl" """
+    outputs = [name.strip().lower() for name in report_outputs.split(",") if name.strip()]
+    unknown = [name for name in outputs if name not in REPORT_WRITERS]
+    if unknown:
+        logger.error(
+            "Unknown report output %s, valid values are: %s",
+            ", ".join(unknown),
+            ", ".join(REPORT_WRITERS),
+        )
+        sys.exit(1)
+    return list(dict.fromkeys(outputs))
+
+
+def open_report_writers(stack: ExitStack, app_config: AppSettings) -> list[ReportWriter]:
+    """
+    Open a writer for every configured report output.
+    The text report is written to ``output_path``, the others next to it
+    with their own extension; the writers are closed with the stack.
+    """
+    writers: list[ReportWriter] = []
+    for name in parse_report_outputs(app_config.report_outputs):
+        writer_class = REPORT_WRITERS[name]
+        path = app_config.output_path
+        if writer_class.suffix is not None:
+            path = path.with_suffix(writer_class.suffix)
+        writer = writer_class(path)
+        stack.callback(writer.close)
+        writers.append(writer)
+        logger.debug("Writing %s report to %s", name, path)
+    return writers
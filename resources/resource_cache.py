@@ -0,0 +1,94 @@
+"""On-disk cache for parsed resource files."""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+
+from pathlib import Path
+from typing import Any
+
+from instrumentation.instrumentation import count
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+
+class ResourceCache:
+    """Pickle parsed resources keyed by file path, mtime, size and parser version.
+
+    Each resource gets a single entry file; the stored key is compared with the
+    current state of the source file, so a modified file (or a new parser
+    version) simply overwrites the stale entry.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        # Resources are loaded from several threads
+        self._lock = threading.Lock()
+
+    def _entry_path(self, resource_path: Path, parser_id: str) -> Path:
+        digest = hashlib.sha1(f"{resource_path}|{parser_id}".encode("utf-8")).hexdigest()
+        return self.directory / f"{resource_path.name}-{digest[:16]}.pickle"
+
+    @staticmethod
+    def _key(resource_path: Path, parser_id: str, parser_version: int) -> tuple:
+        stat = resource_path.stat()
+        return (
+            CACHE_FORMAT_VERSION,
+            str(resource_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            parser_id,
+            parser_version,
+        )
+
+    def load(self, resource_path: Path, parser_id: str, parser_version: int) -> tuple[bool, Any]:
+        """Return ``(True, value)`` on a cache hit, ``(False, None)`` otherwise."""
+
+        entry_path = self._entry_path(resource_path, parser_id)
+        try:
+            key = self._key(resource_path, parser_id, parser_version)
+            with entry_path.open("rb") as handle:
+                stored_key, value = pickle.load(handle)
+        except FileNotFoundError:
+            stored_key, value = None, None
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as error:
+            logger.warning("Ignoring unreadable cache entry %s: %s", entry_path, error)
+            stored_key, value = None, None
+
+        if stored_key is not None and stored_key == key:
+            with self._lock:
+                self.hits += 1
+            count("resource cache hits")
+            logger.debug("Resource cache hit for %s", resource_path)
+            return True, value
+
+        with self._lock:
+            self.misses += 1
+        count("resource cache misses")
+        logger.debug("Resource cache miss for %s", resource_path)
+        return False, None
+
+    def store(self, resource_path: Path, parser_id: str, parser_version: int, value: Any) -> None:
+        """Persist ``value`` for the current state of ``resource_path``."""
+
+        entry_path = self._entry_path(resource_path, parser_id)
+        temporary_path = entry_path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            key = self._key(resource_path, parser_id, parser_version)
+            with temporary_path.open("wb") as handle:
+                pickle.dump((key, value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, entry_path)
+        except OSError as error:
+            logger.warning("Could not write cache entry %s: %s", entry_path, error)
+
+    def log_stats(self) -> None:
+        """Log the hit/miss counters."""
+        logger.info("Resource cache | hits=%d misses=%d (%s)", self.hits, self.misses, self.directory)
@@ -1,51 +1,105 @@
 """Common helpers for loading text-based resources."""
 
 import logging
+import mmap
 
 from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import TextIO, TypeVar
 
+from .resource_cache import ResourceCache
+from .text_decoding import open_text
+
 
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+_resource_cache: ResourceCache | None = None
+
+
+def configure_resource_cache(directory: Path | None) -> ResourceCache | None:
+    """Enable the on-disk cache of parsed resources, or disable it with ``None``."""
+
+    global _resource_cache  # pylint: disable=global-statement
+    _resource_cache = ResourceCache(directory) if directory is not None else None
+    if _resource_cache is not None:
+        logger.info("Resource cache enabled at %s", directory)
+    return _resource_cache
+
+
+def get_resource_cache() -> ResourceCache | None:
+    """Return the active resource cache, if any."""
+    return _resource_cache
+
 
 def load_resource(
     root: str | Path,
     relative_path: Iterable[str],
     parser: Callable[[TextIO], T],
     resource_label: str,
+    parser_version: int = 1,
+    bytes_parser: Callable[[mmap.mmap, Path], T] | None = None,
 ) -> T:
     """Open a resource file and delegate parsing to ``parser``.
 
     The helper centralises logging, path resolution, and error handling for
-    resource readers that all follow the same pattern.
+    resource readers that all follow the same pattern. The file is read once
+    and decoded as UTF-8 or, failing that, Windows-1251 before parsing. When
+    the resource cache is enabled, an unchanged file is served from the cache
+    without parsing; bump ``parser_version`` whenever the parser output changes.
+
+    ``bytes_parser`` is an optional fast path working on the memory-mapped raw
+    file; it must return the same result as ``parser``, which is still used
+    for empty files.
     """
 
     resource_path = Path(root, *relative_path)
     logger.info("Loading %s from %s", resource_label, resource_path)
 
+    cache = _resource_cache
+    active_parser = bytes_parser or parser
+    parser_id = f"{active_parser.__module__}.{active_parser.__qualname__}"
+    if cache is not None and resource_path.is_file():
+        hit, cached = cache.load(resource_path, parser_id, parser_version)
+        if hit:
+            _log_result_size(cached, resource_label)
+            return cached
+
     try:
-        try:
-            with resource_path.open(encoding="utf-8") as handle:
-                result = parser(handle)
-        except UnicodeDecodeError:
-            logger.warning(
-                "Failed to decode %s as UTF-8; retrying with Windows-1251 encoding",
-                resource_path,
-            )
-            with resource_path.open(encoding="cp1251") as handle:
-                result = parser(handle)
+        result = _parse_resource(resource_path, parser, bytes_parser)
     except FileNotFoundError:
         logger.exception("%s not found at %s", resource_label, resource_path)
         raise
 
+    if cache is not None:
+        cache.store(resource_path, parser_id, parser_version, result)
+
     _log_result_size(result, resource_label)
     return result
 
 
+def _parse_resource(
+    resource_path: Path,
+    parser: Callable[[TextIO], T],
+    bytes_parser: Callable[[mmap.mmap, Path], T] | None,
+) -> T:
+    if bytes_parser is not None:
+        with resource_path.open("rb") as raw_handle:
+            try:
+                mapped = mmap.mmap(raw_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped
+                mapped = None
+            if mapped is not None:
+                with mapped:
+                    return bytes_parser(mapped, resource_path)
+
+    handle, _ = open_text(resource_path)
+    with handle:
+        return parser(handle)
+
+
 def _log_result_size(result: object, resource_label: str) -> None:
     if hasattr(result, "__len__"):
         try:
@@ -0,0 +1,131 @@
+"""Decode the game text files, which are UTF-8 or legacy Windows-1251."""
+
+import codecs
+import io
+import itertools
+import logging
+import re
+
+from codecs import BOM_UTF8
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+LEGACY_ENCODING = "cp1251"
+# Error handler for the byte Windows-1251 leaves undefined (0x98): it is decoded
+# to the C1 control of the same value, as Latin-1 does, and encoded back to it,
+# so a file read and written again keeps its bytes
+LEGACY_ERRORS = "legacy-c1-controls"
+
+_BARE_CR = re.compile(rb"\r(?!\n)")
+
+
+def _legacy_c1_controls(error: UnicodeError) -> tuple[str | bytes, int]:
+    if isinstance(error, UnicodeDecodeError):
+        undefined = error.object[error.start : error.end]
+        return "".join(chr(byte) for byte in undefined), error.end
+    if isinstance(error, UnicodeEncodeError):
+        characters = error.object[error.start : error.end]
+        if all(0x80 <= ord(character) <= 0x9F for character in characters):
+            return bytes(ord(character) for character in characters), error.end
+    raise error
+
+
+codecs.register_error(LEGACY_ERRORS, _legacy_c1_controls)
+
+
+def decode_text(data: bytes, path: Path) -> tuple[str, str]:
+    """Decode the contents of ``path`` and return the text and its encoding.
+
+    The buffer is decoded as UTF-8 first, which also validates it; only files
+    that are not valid UTF-8 are decoded again, as Windows-1251. The parsers
+    therefore always run once, on the decoded text. The byte Windows-1251
+    leaves undefined is kept as a C1 control (see ``LEGACY_ERRORS``), so
+    the text encodes back to the same bytes.
+    """
+
+    if data.startswith(BOM_UTF8):
+        return data[len(BOM_UTF8) :].decode("utf-8"), "utf-8-sig"
+    try:
+        return data.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError as error:
+        logger.warning(
+            "%s is not valid UTF-8 (byte %d); reading it as Windows-1251",
+            path,
+            error.start,
+        )
+    return data.decode(LEGACY_ENCODING, errors=LEGACY_ERRORS), LEGACY_ENCODING
+
+
+class LinePattern:
+    """Byte regex matched at the start of every line of a raw file buffer.
+
+    Leading the search with a newline byte keeps the regex engine on its fast
+    literal scan; the first line is matched on its own, and the slower
+    ``[\\r\\n]`` prefix is only used for files with bare CR line endings.
+    """
+
+    def __init__(self, pattern: bytes) -> None:
+        self._first_line = re.compile(pattern)
+        self._after_lf = re.compile(rb"\n" + pattern)
+        self._after_cr_or_lf = re.compile(rb"[\r\n]" + pattern)
+
+    def find_groups(self, data: bytes) -> list[bytes]:
+        """Return the groups of every line matching the pattern, flattened."""
+
+        start = len(BOM_UTF8) if data[: len(BOM_UTF8)] == BOM_UTF8 else 0
+        with memoryview(data)[start:] as view:
+            groups: list[bytes] = []
+            first_line = self._first_line.match(view)
+            if first_line is not None:
+                groups.extend(first_line.groups())
+            pattern = self._after_cr_or_lf if _BARE_CR.search(view) else self._after_lf
+            if pattern.groups == 1:
+                groups.extend(pattern.findall(view))
+            else:
+                groups.extend(itertools.chain.from_iterable(pattern.findall(view)))
+            return groups
+
+
+def decode_identifiers(raw_identifiers: list[bytes], data: bytes, path: Path) -> list[str]:
+    """Decode identifiers extracted from the raw contents ``data`` of ``path``.
+
+    The identifiers never span lines, so they are decoded in one call, joined
+    by newlines. Identifiers are nearly always ASCII; the encoding of the
+    whole buffer is only detected when one of them is not.
+    """
+
+    if not raw_identifiers:
+        return []
+    joined = b"\n".join(raw_identifiers)
+    if joined.isascii():
+        return joined.decode("ascii").split("\n")
+
+    encoding = "utf-8"
+    try:
+        codecs.decode(data, "utf-8")
+    except UnicodeDecodeError as error:
+        logger.warning(
+            "%s is not valid UTF-8 (byte %d); reading it as Windows-1251",
+            path,
+            error.start,
+        )
+        encoding = LEGACY_ENCODING
+    return joined.decode(encoding, errors=LEGACY_ERRORS).split("\n")
+
+
+def text_stream(data: bytes, path: Path) -> tuple[io.StringIO, str]:
+    """Return a text stream over the decoded ``data`` read from ``path``.
+
+    Newlines are translated like a file opened in text mode, so the parsers
+    see the same lines they would read from ``path.open()``.
+    """
+
+    text, encoding = decode_text(data, path)
+    return io.StringIO(text, newline=None), encoding
+
+
+def open_text(path: Path) -> tuple[io.StringIO, str]:
+    """Read ``path`` once and return a text stream over its decoded contents."""
+    return text_stream(path.read_bytes(), path)
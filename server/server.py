@@ -0,0 +1,285 @@
+"""Local validation daemon answering JSON requests over HTTP.
+
+The STD resources are loaded once and kept in worker processes, so tools
+validating missions pay neither the startup nor the resource parsing cost.
+Endpoints (all answers are JSON):
+
+- ``GET /health``: status, catalog sizes and number of missions validated
+- ``POST /validate/mission``: ``{"path": "..."}`` or ``{"name": "x.mis", "text": "..."}``
+- ``POST /validate/campaign``: ``{"path": "<campaign folder>"}``
+- ``POST /reload``: read the STD resources again
+
+The server only validates: the auto-fixes are never applied to the missions.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from analyzer.analyzer import MissionReport, validate_mission
+from catalog.catalog import AssetCatalog, load_catalog
+from config.app_settings import AppSettings
+from missions.missions import find_campaign_ini, parse_mission_text, read_mission, read_missions
+from report.findings import finding_record
+from report.writers import format_mission_text
+from resources.resource_loader import configure_resource_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Missions are a few MB at most; anything larger is not a mission
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+# Per-process state of the validation workers
+_worker_catalog: AssetCatalog | None = None
+
+
+class RequestError(Exception):
+    """A request that can not be served, answered with ``status``."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _init_worker(catalog: AssetCatalog) -> None:
+    global _worker_catalog  # pylint: disable=global-statement
+    _worker_catalog = catalog
+
+
+def _validate_file(mission_path: Path, app_config: AppSettings) -> MissionReport:
+    assert _worker_catalog is not None
+    try:
+        mission_data = read_mission(mission_path)
+    except SystemExit as error:
+        # The mission reader stops the run on broken missions; the worker must survive
+        raise ValueError(f"Mission {mission_path.name} could not be read") from error
+    return validate_mission(mission_data, _worker_catalog, app_config)
+
+
+def _validate_text(mission_name: str, text: str, app_config: AppSettings) -> MissionReport:
+    assert _worker_catalog is not None
+    try:
+        mission_data = parse_mission_text(Path(mission_name), text)
+    except SystemExit as error:
+        raise ValueError(f"Mission {mission_name} could not be read") from error
+    return validate_mission(mission_data, _worker_catalog, app_config)
+
+
+def _report_to_json(report: MissionReport) -> dict[str, Any]:
+    return {
+        "mission": report.mission_name,
+        "findings": [finding_record(finding) for finding in report.findings],
+        "report": format_mission_text(report),
+    }
+
+
+class ValidationService:
+    """Catalog and worker pool shared by every request."""
+
+    def __init__(self, app_config: AppSettings) -> None:
+        self.app_config = replace(
+            app_config,
+            auto_correct_static_markings=False,
+            auto_replace_stationary_objects=False,
+            make_non_player_ai_only=False,
+        )
+        jobs = app_config.jobs if app_config.jobs > 0 else os.cpu_count() or 1
+        self.jobs = max(1, jobs)
+        self.catalog: AssetCatalog | None = None
+        self.missions_validated = 0
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def reload(self) -> dict[str, Any]:
+        """Read the STD resources and replace the workers.
+
+        Requests already queued finish on the previous workers.
+        """
+        started = time.perf_counter()
+        configure_resource_cache(
+            self.app_config.cache_directory if self.app_config.use_resource_cache else None
+        )
+        catalog = load_catalog(self.app_config)
+        pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker, initargs=(catalog,))
+        with self._lock:
+            previous, self._pool, self.catalog = self._pool, pool, catalog
+        if previous is not None:
+            previous.shutdown(wait=False)
+        logger.info("Resources loaded, %d validation workers", self.jobs)
+        return {"catalog": catalog.counts(), "elapsed_ms": _elapsed_ms(started)}
+
+    def close(self) -> None:
+        """Stop the workers."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _submit(self, tasks: list[tuple[Any, ...]]) -> list[Future]:
+        with self._lock:
+            if self._pool is None:
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Resources not loaded")
+            return [self._pool.submit(*task) for task in tasks]
+
+    def _collect(self, futures: list[Future]) -> list[MissionReport]:
+        try:
+            reports = [future.result() for future in futures]
+        except ValueError as error:
+            raise RequestError(HTTPStatus.UNPROCESSABLE_ENTITY, str(error)) from error
+        with self._lock:
+            self.missions_validated += len(reports)
+        return reports
+
+    def health(self) -> dict[str, Any]:
+        """Status of the service."""
+        catalog = self.catalog
+        return {
+            "status": "ok" if catalog is not None else "loading",
+            "catalog": catalog.counts() if catalog is not None else None,
+            "workers": self.jobs,
+            "missions_validated": self.missions_validated,
+        }
+
+    def validate_mission(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Validate a mission file (``path``) or mission contents (``name`` and ``text``)."""
+        started = time.perf_counter()
+        if "text" in request:
+            task = (_validate_text, str(request.get("name", "mission.mis")), str(request["text"]), self.app_config)
+        elif "path" in request:
+            mission_path = Path(request["path"])
+            if not mission_path.is_file():
+                raise RequestError(HTTPStatus.NOT_FOUND, f"Mission file not found: {mission_path}")
+            task = (_validate_file, mission_path, self.app_config)
+        else:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Expected 'path' or 'text'")
+
+        (report,) = self._collect(self._submit([task]))
+        return {**_report_to_json(report), "elapsed_ms": _elapsed_ms(started)}
+
+    def validate_campaign(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Validate every mission listed in the campaign.ini of ``path``."""
+        started = time.perf_counter()
+        if "path" not in request:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Expected 'path'")
+        campaign_path = Path(request["path"])
+        if find_campaign_ini(campaign_path) is None:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"campaign.ini not found in {campaign_path}")
+
+        try:
+            mission_list = read_missions(campaign_path)
+        except SystemExit as error:
+            # The campaign reader stops the run on a broken campaign.ini; the handler thread must survive
+            raise RequestError(
+                HTTPStatus.UNPROCESSABLE_ENTITY, f"The campaign.ini of {campaign_path} could not be read"
+            ) from error
+        missing = [mission_path.name for mission_path in mission_list if not mission_path.is_file()]
+        if missing:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Missions not found: {', '.join(missing)}")
+
+        app_config = replace(self.app_config, campaign_path=campaign_path)
+        reports = self._collect(
+            self._submit([(_validate_file, mission_path, app_config) for mission_path in mission_list])
+        )
+        return {
+            "campaign": str(campaign_path),
+            "missions": [_report_to_json(report) for report in reports],
+            "missing_maps": sorted({report.missing_map for report in reports if report.missing_map}),
+            "missing_objects": sorted(set().union(*(report.missing_objects for report in reports))),
+            "elapsed_ms": _elapsed_ms(started),
+        }
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """Route the JSON requests to the validation service."""
+
+    server: "ValidationServer"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer ``GET /health``."""
+        if self.path == "/health":
+            self._answer(HTTPStatus.OK, self.server.service.health())
+        else:
+            self._answer(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer the validation and reload requests."""
+        service = self.server.service
+        routes = {
+            "/validate/mission": service.validate_mission,
+            "/validate/campaign": service.validate_campaign,
+            "/reload": lambda _: service.reload(),
+        }
+        try:
+            route = routes.get(self.path)
+            if route is None:
+                raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown endpoint {self.path}")
+            self._answer(HTTPStatus.OK, route(self._read_json()))
+        except RequestError as error:
+            self._answer(error.status, {"error": str(error)})
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.exception("Request %s failed", self.path)
+            self._answer(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)})
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request too large")
+        if length == 0:
+            return {}
+        try:
+            request = json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, json.JSONDecodeError) as error:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {error}") from error
+        if not isinstance(request, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Expected a JSON object")
+        return request
+
+    def _answer(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        encoded = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class ValidationServer(ThreadingHTTPServer):
+    """HTTP server sharing one :class:`ValidationService` between its request threads."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ValidationService) -> None:
+        super().__init__(address, ValidationRequestHandler)
+        self.service = service
+
+
+def serve(app_config: AppSettings, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """Load the resources and answer requests until interrupted."""
+
+    service = ValidationService(app_config)
+    service.reload()
+    with ValidationServer((host, port), service) as server:
+        print(f"Validation server listening on http://{host}:{server.server_port}")
+        print("Press Ctrl+C to stop")
+        try:
+            server.serve_forever()
+        finally:
+            service.close()
@@ -1,31 +1,114 @@
 """Utilities for scanning skin directories."""
 
 import logging
+import os
+import pickle
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from instrumentation.instrumentation import count, timed
+
 
 # TODO: Support more skin file types if needed (.jpg, .tga, etc.)
 SKIN_SUFFIXES = {".bmp"}
 
+SKIN_INDEX_FILE_NAME = "skins-index.pickle"
+# Bump when the layout of the skin index changes
+SKIN_INDEX_VERSION = 1
+# Folder listings are I/O bound (often on network shares), threads overlap them
+SCAN_WORKERS = 8
+
 
 logger = logging.getLogger(__name__)
 
 
-def read_skins(root: Path) -> dict[str, list[str]]:
-    """Return a mapping of skin folders (lowercased) to available skins."""
+def _list_skin_files(folder_path: str) -> frozenset[str]:
+    with os.scandir(folder_path) as entries:
+        return frozenset(
+            entry.name
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SKIN_SUFFIXES
+        )
+
+
+def _load_skin_index(index_path: Path, root: Path) -> dict[str, tuple[int, frozenset[str]]]:
+    try:
+        with index_path.open("rb") as handle:
+            version, indexed_root, folders = pickle.load(handle)
+    except FileNotFoundError:
+        return {}
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as error:
+        logger.warning("Ignoring unreadable skin index %s: %s", index_path, error)
+        return {}
+
+    if version != SKIN_INDEX_VERSION or indexed_root != str(root):
+        return {}
+    return folders
+
+
+def _save_skin_index(index_path: Path, root: Path, folders: dict[str, tuple[int, frozenset[str]]]) -> None:
+    temporary_path = index_path.with_suffix(".tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with temporary_path.open("wb") as handle:
+            pickle.dump((SKIN_INDEX_VERSION, str(root), folders), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, index_path)
+    except OSError as error:
+        logger.warning("Could not write skin index %s: %s", index_path, error)
+
+
+@timed("read_skins")
+def read_skins(root: Path, cache_directory: Path | None = None) -> dict[str, frozenset[str]]:
+    """Return a mapping of skin folders (lowercased) to available skins.
+
+    The aircraft folders are listed in a thread pool. With ``cache_directory``
+    the listings are kept in an index keyed on each folder's mtime, so only the
+    folders where skins were added, removed or renamed are listed again.
+    """
 
     logger.info("Scanning skins in %s", root)
 
-    # Dictionary of skin folder (lowercase) to list of skin filenames
-    skin_directory: dict[str, list[str]] = {}
+    index_path = cache_directory / SKIN_INDEX_FILE_NAME if cache_directory is not None else None
+    cached_folders = _load_skin_index(index_path, root) if index_path is not None else {}
+
+    # Folder path -> (mtime, skin filenames)
+    folders: dict[str, tuple[int, frozenset[str]]] = {}
+    # Folder name (lowercase) -> folder path
+    folder_names: dict[str, str] = {}
+    stale_folders: list[tuple[str, int]] = []
+
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            folder_names[entry.name.lower()] = entry.path
+            mtime = entry.stat().st_mtime_ns
+            cached = cached_folders.get(entry.path)
+            if cached is not None and cached[0] == mtime:
+                folders[entry.path] = cached
+            else:
+                stale_folders.append((entry.path, mtime))
+
+    if stale_folders:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            listings = executor.map(_list_skin_files, [path for path, _ in stale_folders])
+            for (path, mtime), skin_files in zip(stale_folders, listings):
+                folders[path] = (mtime, skin_files)
+
+    if index_path is not None and (stale_folders or len(folders) != len(cached_folders)):
+        _save_skin_index(index_path, root, folders)
 
-    for subdir in root.iterdir():
-        if not subdir.is_dir():
-            continue
+    count("skin folders listed", len(stale_folders))
+    count("skin folders from index", len(folders) - len(stale_folders))
 
-        entries = [file.name for file in subdir.iterdir() if file.suffix.lower() in SKIN_SUFFIXES]
-        skin_directory[subdir.name.lower()] = sorted(entries)
+    # Dictionary of skin folder (lowercase) to the set of skin filenames
+    skin_directory = {name: folders[path][1] for name, path in folder_names.items()}
 
-    logger.debug("Collected skins for %d folders", len(skin_directory))
+    logger.debug(
+        "Collected skins for %d folders (%d listed, %d from the skin index)",
+        len(skin_directory),
+        len(stale_folders),
+        len(skin_directory) - len(stale_folders),
+    )
     return skin_directory
@@ -6,6 +6,7 @@ Get the squadrons from the STD/i18n/regInfo.propertie file
 from pathlib import Path
 from typing import Iterator, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 
@@ -30,6 +31,7 @@ def _parse_squadrons(handle: TextIO) -> list[str]:
     return squadrons
 
 
+@timed("read_squadrons")
 def read_squadrons(root: Path) -> list[str]:
     """Read squadrons from regInfo.properties"""
 
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Iterable, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 
@@ -23,6 +24,7 @@ def _parse_stationaries(handle: TextIO) -> dict[str, str]:
     return stationaries
 
 
+@timed("read_stationaries")
 def read_stationaries(root: str | Path) -> dict[str, str]:
     """Read stationary class identifiers mapped to display names."""
 
@@ -0,0 +1,159 @@
+"""Nearest-name suggestions for the assets missing from the STD installation.
+
+The identifiers of the catalog are indexed once by character trigrams, so
+the candidates for a missing name are the catalog names sharing trigrams
+with it, found from the posting lists instead of comparing the name with
+every entry of the catalog.
+"""
+
+import logging
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Set
+
+from catalog.catalog import PLANE_STATIONARY_PREFIX, AssetCatalog
+from report.aggregation import CampaignIndex
+from report.findings import Category
+
+logger = logging.getLogger(__name__)
+
+DRAFT_CONVERSIONS_FILE_NAME = "_draft_conversions.txt"
+DEFAULT_LIMIT = 3
+# Candidates scoring less are not worth a look
+MIN_SCORE = 0.35
+# Share of the score given to the class name (the part after "$")
+KEY_WEIGHT = 0.75
+# Candidates scored per suggestion returned
+SHORTLIST_FACTOR = 10
+COMMON_GRAM_DIVISOR = 20
+MIN_COMMON_GRAM_SIZE = 50
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text.casefold()} "
+    return {padded[position:position + 3] for position in range(len(padded) - 2)}
+
+
+def _key(name: str) -> str:
+    # vehicles.stationary.Stationary$RAF_Bus -> RAF_Bus: the package part is
+    # what changes between mod packs, the class name usually stays the same
+    return name.rsplit("$", 1)[-1]
+
+
+def _dice(first: Set[str], second: Set[str]) -> float:
+    return 2 * len(first & second) / (len(first) + len(second))
+
+
+class SuggestionIndex:
+    """Trigram index over a set of identifiers, answering nearest-name queries."""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = sorted(set(names))
+        self._key_grams: list[frozenset[str]] = []
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            grams = frozenset(_trigrams(_key(name)))
+            self._key_grams.append(grams)
+            for gram in grams:
+                postings[gram].append(position)
+        self._postings = dict(postings)
+        # Trigrams found in more names are not used to gather the candidates
+        self._common_size = max(len(self.names) // COMMON_GRAM_DIVISOR, MIN_COMMON_GRAM_SIZE)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def suggest(self, name: str, limit: int = DEFAULT_LIMIT) -> list[tuple[str, float]]:
+        """Return up to ``limit`` ``(candidate, score)`` pairs, the closest first.
+
+        The score, between 0 and 1, mostly weighs the similarity of the class
+        names (after "$"); the full identifiers break the ties.
+        """
+
+        key_grams = _trigrams(_key(name))
+        postings = [self._postings[gram] for gram in key_grams if gram in self._postings]
+        # Common trigrams ("sta", "tio", ...) hit thousands of names without telling them apart
+        rare_postings = [positions for positions in postings if len(positions) <= self._common_size]
+        shared: Counter[int] = Counter()
+        for positions in rare_postings or postings:
+            shared.update(positions)
+        if not shared:
+            return []
+
+        # Only the names sharing most trigrams are scored, the others can not come close
+        full_grams = _trigrams(name)
+        scored = []
+        for position, _ in shared.most_common(limit * SHORTLIST_FACTOR):
+            candidate = self.names[position]
+            score = KEY_WEIGHT * _dice(key_grams, self._key_grams[position])
+            score += (1 - KEY_WEIGHT) * _dice(full_grams, _trigrams(candidate))
+            if score >= MIN_SCORE and candidate != name:
+                scored.append((candidate, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+
+class CatalogSuggestions:
+    """Suggestion indexes over the catalog, built on first use and then reused."""
+
+    def __init__(self, catalog: AssetCatalog) -> None:
+        self.catalog = catalog
+        self._indexes: dict[Category, SuggestionIndex] = {}
+
+    def _names(self, category: Category) -> Iterable[str]:
+        if category == Category.MISSING_OBJECT:
+            return self.catalog.objects
+        if category == Category.MISSING_STATIONARY:
+            # Static planes can be replaced by any aircraft of air.ini
+            planes = (PLANE_STATIONARY_PREFIX + code for code in self.catalog.aircraft_classes)
+            return [*self.catalog.stationaries, *planes]
+        if category == Category.MISSING_CHIEF:
+            return self.catalog.chiefs
+        raise ValueError(f"No suggestions for {category}")
+
+    def index(self, category: Category) -> SuggestionIndex:
+        """Return the index of the catalog names that can replace a ``category`` finding."""
+        if category not in self._indexes:
+            self._indexes[category] = SuggestionIndex(self._names(category))
+            logger.debug("Indexed %d names for %s suggestions", len(self._indexes[category]), category)
+        return self._indexes[category]
+
+    def suggest(self, category: Category, name: str, limit: int = DEFAULT_LIMIT) -> list[tuple[str, float]]:
+        """Return the catalog names closest to the missing ``name``."""
+        return self.index(category).suggest(name, limit)
+
+
+# Findings whose identifier can be replaced through the conversions file
+SUGGESTED_CATEGORIES = (Category.MISSING_STATIONARY, Category.MISSING_CHIEF, Category.MISSING_OBJECT)
+
+
+def format_draft_conversions(
+    index: CampaignIndex, suggestions: CatalogSuggestions, limit: int = DEFAULT_LIMIT
+) -> str:
+    """
+    Return a draft conversions file replacing each missing name by its closest
+    match, the names affecting most missions first. The other candidates are
+    listed in a comment, so the file must be checked before it is merged into
+    Common Conversions.txt.
+    """
+    lines = [
+        "# Draft conversions generated from the missing objects of the campaign",
+        "# Check every entry before copying it to Common Conversions.txt",
+    ]
+    for category in SUGGESTED_CATEGORIES:
+        ranked = index.ranked_issues(category)
+        if not ranked:
+            continue
+        lines.append("")
+        lines.append(f"# {category} ({len(ranked)})")
+        for (identifier, _), mission_count in ranked:
+            candidates = suggestions.suggest(category, identifier, limit)
+            if not candidates:
+                lines.append(f"# {identifier}: no close match ({mission_count} missions)")
+                continue
+            others = ", ".join(f"{candidate} ({score:.2f})" for candidate, score in candidates[1:])
+            best, score = candidates[0]
+            comment = f"# {identifier}: {score:.2f}, {mission_count} missions"
+            lines.append(comment + (f"; also {others}" if others else ""))
+            lines.append(f"{identifier},{best}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,187 @@
+"""Watch a campaign and re-validate missions as soon as they are saved."""
+
+import logging
+import os
+import time
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from analyzer.analyzer import validate_mission
+from catalog.catalog import AssetCatalog, load_catalog
+from config.app_settings import AppSettings
+from missions.missions import read_mission, read_missions
+from report.findings import Finding
+from resources.resource_loader import configure_resource_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+# (mtime_ns, size) of a file, None while it does not exist
+FileSignature = tuple[int, int] | None
+FindingKey = tuple[str, str, str, str]
+
+
+def _signature(path: Path) -> FileSignature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _finding_key(finding: Finding) -> FindingKey:
+    return finding.severity, finding.category, finding.identifier, finding.detail
+
+
+@dataclass
+class MissionChange:
+    """Result of re-validating one mission."""
+
+    mission_name: str
+    added: list[FindingKey]
+    resolved: list[FindingKey]
+    elapsed: float
+    error: str | None = None
+
+
+class CampaignWatcher:
+    """Keep the catalog in memory and re-validate the missions that change.
+
+    Files are polled by size and modification time; a mission is only read
+    once its signature was the same on two consecutive polls, so a save still
+    in progress in the FMB is not parsed half-written. Changes to the STD
+    resources are not watched: restart the watcher after editing them.
+    """
+
+    def __init__(self, app_config: AppSettings, catalog: AssetCatalog) -> None:
+        self.app_config = app_config
+        self.catalog = catalog
+        self.campaign_path = Path(app_config.campaign_path)
+        self.campaign_ini = self.campaign_path / "campaign.ini"
+        self._campaign_signature: FileSignature = None
+        self._missions: list[Path] = []
+        self._signatures: dict[Path, FileSignature] = {}
+        self._pending: dict[Path, FileSignature] = {}
+        self._findings: dict[Path, dict[FindingKey, None]] = {}
+
+    @property
+    def missions(self) -> list[Path]:
+        """The missions listed in campaign.ini."""
+        return self._missions
+
+    def findings(self, mission_path: Path) -> list[FindingKey]:
+        """The current findings of a mission, in report order."""
+        return list(self._findings.get(mission_path, ()))
+
+    def start(self) -> list[MissionChange]:
+        """Validate every mission of the campaign once."""
+        self._campaign_signature = _signature(self.campaign_ini)
+        self._missions = read_missions(self.campaign_path)
+        changes = []
+        for mission_path in self._missions:
+            self._signatures[mission_path] = _signature(mission_path)
+            changes.append(self._revalidate(mission_path))
+        return changes
+
+    def poll(self) -> list[MissionChange]:
+        """Re-validate the missions saved since the last poll."""
+
+        campaign_signature = _signature(self.campaign_ini)
+        if campaign_signature is not None and campaign_signature != self._campaign_signature:
+            self._campaign_signature = campaign_signature
+            self._reload_mission_list()
+
+        changes = []
+        for mission_path in self._missions:
+            signature = _signature(mission_path)
+            if signature == self._signatures.get(mission_path):
+                self._pending.pop(mission_path, None)
+                continue
+            if mission_path not in self._pending or self._pending[mission_path] != signature:
+                # Changed since the last poll: wait until the save is finished
+                self._pending[mission_path] = signature
+                continue
+            del self._pending[mission_path]
+            self._signatures[mission_path] = signature
+            changes.append(self._revalidate(mission_path))
+        return changes
+
+    def _reload_mission_list(self) -> None:
+        missions = read_missions(self.campaign_path)
+        removed = set(self._missions) - set(missions)
+        for mission_path in removed:
+            logger.info("Mission %s removed from the campaign", mission_path.name)
+            self._signatures.pop(mission_path, None)
+            self._pending.pop(mission_path, None)
+            self._findings.pop(mission_path, None)
+        for mission_path in missions:
+            # New missions are validated on the next polls, like any change
+            self._signatures.setdefault(mission_path, None)
+        self._missions = missions
+
+    def _revalidate(self, mission_path: Path) -> MissionChange:
+        started = time.perf_counter()
+        previous = self._findings.get(mission_path, {})
+        if self._signatures.get(mission_path) is None:
+            self._findings.pop(mission_path, None)
+            return MissionChange(mission_path.name, [], [], time.perf_counter() - started, "file not found")
+
+        try:
+            mission_data = read_mission(mission_path)
+        except SystemExit:
+            # The mission reader stops the run on broken missions; keep watching instead
+            return MissionChange(
+                mission_path.name, [], [], time.perf_counter() - started, "could not be read, see the log"
+            )
+        mission_report = validate_mission(mission_data, self.catalog, self.app_config)
+
+        current = dict.fromkeys(_finding_key(finding) for finding in mission_report.findings)
+        self._findings[mission_path] = current
+        return MissionChange(
+            mission_path.name,
+            added=[key for key in current if key not in previous],
+            resolved=[key for key in previous if key not in current],
+            elapsed=time.perf_counter() - started,
+        )
+
+
+def format_change(change: MissionChange) -> str:
+    """Return the console lines describing a re-validated mission."""
+
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    header = f"[{timestamp}] {change.mission_name} validated in {change.elapsed * 1000:.1f} ms"
+    if change.error is not None:
+        return f"{header}: {change.error}"
+
+    lines = [header]
+    for sign, keys in (("+", change.added), ("-", change.resolved)):
+        for severity, category, identifier, detail in keys:
+            line = f"  {sign} {severity:<7} {category} {identifier}"
+            lines.append(f"{line} ({detail})" if detail else line)
+    if len(lines) == 1:
+        lines.append("  no changes in the findings")
+    return "\n".join(lines)
+
+
+def watch_campaign(app_config: AppSettings, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+    """Validate the campaign, then re-validate every mission saved until interrupted."""
+
+    configure_resource_cache(app_config.cache_directory if app_config.use_resource_cache else None)
+    catalog = load_catalog(app_config)
+    watcher = CampaignWatcher(app_config, catalog)
+
+    total = 0
+    for change in watcher.start():
+        if change.error is not None:
+            print(format_change(change))
+        total += len(change.added)
+    print(f"Watching {len(watcher.missions)} missions of {watcher.campaign_path} ({total} findings)")
+    print("Press Ctrl+C to stop")
+
+    while True:
+        time.sleep(interval)
+        for change in watcher.poll():
+            print(format_change(change), flush=True)
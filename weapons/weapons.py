@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Iterable, TextIO
 
+from instrumentation.instrumentation import timed
 from resources.resource_loader import load_resource
 
 
@@ -22,6 +23,7 @@ def _parse_weapons(handle: TextIO) -> dict[str, list[str]]:
     return weapons_list
 
 
+@timed("read_weapons")
 def read_weapons(root: str | Path) -> dict[str, list[str]]:
     """Return a mapping of aircraft class identifiers to their available weapons."""
 